@@ -0,0 +1,16 @@
+# AutoDriveTranslationTool/__main__.py
+
+import os
+import sys
+from multiprocessing import freeze_support
+
+# The application imports its modules both as "src.*" and "AutoDriveTranslationTool.src.*".
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AutoDriveTranslationTool.src.core.cli import main
+
+
+if __name__ == "__main__":
+    freeze_support()
+    sys.exit(main())
@@ -1,5 +1,7 @@
 # AutoDriveTranslationTool/main.py
 
+from multiprocessing import freeze_support
+
 from GuiFramework.utilities.file_ops import FileOps
 from GuiFramework.utilities.logging.logger import Logger, LoggerConfig, LOG_LEVEL
 
@@ -28,4 +30,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Required for the translation process pool in the frozen executable.
+    freeze_support()
     main()
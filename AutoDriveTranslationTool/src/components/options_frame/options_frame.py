@@ -36,6 +36,7 @@ class OptionsFrame:
             self.gui_instance.btn_reset_ui_appearance_settings: self.logic_instance._on_reset_ui_appearance_settings_button,
 
             self.gui_instance.checkbox_whole_word_replacement: self.logic_instance._on_whole_word_replacement_checkbox,
+            self.gui_instance.checkbox_enable_profiling: self.logic_instance._on_enable_profiling_checkbox,
 
             self.gui_instance.btn_reset_everything: self.logic_instance._on_reset_everything_button,
         }
@@ -177,11 +177,19 @@ class OptionsFrameGui(ctk.CTkFrame):
         self.checkbox_whole_word_replacement = CustomCTKCheckbox(
             checkbox_text="of_checkbox_whole_word_replacement",
             checkbox_properties={"master": self.translation_settings_frame, "variable": CH.get_variable_value(CKL.WHOLE_WORD_REPLACEMENT), "onvalue": True, "offvalue": False, "font": FONT_BIG},
-            pack_type="grid", pack_properties={"row": 1, "column": 0, "padx": (10, 10), "pady": (5, 10), "sticky": "nsew"},
+            pack_type="grid", pack_properties={"row": 1, "column": 0, "padx": (10, 10), "pady": (5, 5), "sticky": "nsew"},
             tooltip_text="of_checkbox_whole_word_replacement_tt",
             loc_func=self.localization_manager.localize
         )
 
+        self.checkbox_enable_profiling = CustomCTKCheckbox(
+            checkbox_text="of_checkbox_enable_profiling",
+            checkbox_properties={"master": self.translation_settings_frame, "variable": CH.get_variable_value(CKL.ENABLE_PROFILING), "onvalue": True, "offvalue": False, "font": FONT_BIG},
+            pack_type="grid", pack_properties={"row": 2, "column": 0, "padx": (10, 10), "pady": (5, 10), "sticky": "nsew"},
+            tooltip_text="of_checkbox_enable_profiling_tt",
+            loc_func=self.localization_manager.localize
+        )
+
     def _construct_frame(self, parent, **grid_options):
         """Create and grid a CTkFrame within the given parent."""
         frame = ctk.CTkFrame(parent)
@@ -98,6 +98,10 @@ class OptionsFrameLogic:
         """Toggle whole word replacement."""
         CH.set_variable_value(CKL.WHOLE_WORD_REPLACEMENT, ctk.BooleanVar(self.gui_instance, self.gui_instance.checkbox_whole_word_replacement.get()))
 
+    def _on_enable_profiling_checkbox(self) -> None:
+        """Toggle profiling of translation runs."""
+        CH.set_variable_value(CKL.ENABLE_PROFILING, ctk.BooleanVar(self.gui_instance, self.gui_instance.checkbox_enable_profiling.get()))
+
     def _on_reset_everything_button(self) -> None:
         """Reset all settings to default."""
         CH.reset_settings([
@@ -110,14 +114,16 @@ class OptionsFrameLogic:
             CKL.UI_THEME,
             CKL.UI_COLOR_THEME,
             CKL.UI_LANGUAGE,
-            CKL.WHOLE_WORD_REPLACEMENT
+            CKL.WHOLE_WORD_REPLACEMENT,
+            CKL.ENABLE_PROFILING
         ])
         self._update_checkboxes({
             CKL.CENTER_WINDOW_ON_STARTUP: self.gui_instance.checkbox_center_window_on_startup,
             CKL.SAVE_WINDOW_SIZE: self.gui_instance.checkbox_save_window_size,
             CKL.SAVE_WINDOW_POS: self.gui_instance.checkbox_save_window_pos,
             CKL.USE_HIGH_DPI_SCALING: self.gui_instance.checkbox_use_high_dpi_scaling,
-            CKL.WHOLE_WORD_REPLACEMENT: self.gui_instance.checkbox_whole_word_replacement
+            CKL.WHOLE_WORD_REPLACEMENT: self.gui_instance.checkbox_whole_word_replacement,
+            CKL.ENABLE_PROFILING: self.gui_instance.checkbox_enable_profiling
         })
 
         self.window.set_ui_theme((CH.get_variable_value(CKL.UI_THEME)).get().lower())
@@ -148,6 +154,7 @@ class OptionsFrameLogic:
 
         self.gui_instance.lbl_translation_settings.update_localization()
         self.gui_instance.checkbox_whole_word_replacement.update_localization()
+        self.gui_instance.checkbox_enable_profiling.update_localization()
 
     # Helper methods
     def _translate_list(self, list_to_translate: list) -> list:
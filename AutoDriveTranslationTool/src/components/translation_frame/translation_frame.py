@@ -36,7 +36,8 @@ class TranslationFrame:
         widget_command_map = {
             self.gui_instance.btn_open_output_dir: lambda: os.startfile(CH.get_variable_value(CKL.OUTPUT_PATH)),
             self.gui_instance.btn_translate: self.logic_instance._on_translate,
-            self.gui_instance.btn_clear_console: lambda: self.gui_instance.textbox_output_console.clear_console(),
+            self.gui_instance.btn_cancel: self.logic_instance._on_cancel,
+            self.gui_instance.btn_clear_console: lambda: self.gui_instance.console_sink.clear_console(),
             input_controls['btn_collapse_all']: lambda: input_files_tree_view.collapse_all(),
             input_controls['btn_expand_all']: lambda: input_files_tree_view.expand_all(),
             input_controls['btn_select_all']: lambda: input_files_tree_view.select_all_file_nodes(),
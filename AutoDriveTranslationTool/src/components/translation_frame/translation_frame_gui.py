@@ -5,11 +5,13 @@ import customtkinter as ctk
 from typing import Optional
 
 from GuiFramework.widgets import CustomCTKButton, FileTreeView, CustomConsoleTextbox
+from GuiFramework.utilities import FileOps
 
 from GuiFramework.utilities.config import ConfigHandler as CH
 from GuiFramework.utilities.config.config_types import ConfigKeyList as CKL
 
 from AutoDriveTranslationTool.src.core.constants import FONT_BIG, FONT_ICON_BIG
+from AutoDriveTranslationTool.src.utilities import BufferedConsoleSink
 
 # do not remove, yet !!!!
 # TODO: this becomes its own module or gets merged in another one
@@ -85,6 +87,13 @@ class TranslationFrameGui(ctk.CTkFrame):
             loc_func=self.localization_manager.localize
         )
 
+        self.btn_cancel = CustomCTKButton(
+            btn_text="tf_btn_cancel", btn_properties={"master": btn_frame, "font": FONT_BIG, "height": 20, "corner_radius": 0},
+            pack_type="pack", pack_properties={"side": "left"},
+            tooltip_text="tf_btn_cancel_tt",
+            loc_func=self.localization_manager.localize
+        )
+
         self.btn_open_output_dir = CustomCTKButton(
             btn_text="📁", btn_properties={"master": btn_frame, "font": FONT_ICON_BIG, "width": 20, "height": 20, "corner_radius": 0},
             pack_type="pack", pack_properties={"side": "left"},
@@ -107,6 +116,14 @@ class TranslationFrameGui(ctk.CTkFrame):
         )
         self.textbox_output_console.grid(row=1, column=0, padx=(10, 10), pady=(0, 10), sticky="nsew")
 
+        # All writers go through the sink so large runs cost a few chunked inserts instead of one per message.
+        self.console_sink = BufferedConsoleSink(
+            self.textbox_output_console,
+            window=self.app_instance.window,
+            log_file_path=FileOps.resolve_development_path(__file__, "logs", "AutoDriveTranslationTool", "console.log", root_marker="AutoDriveTranslationTool"),
+            max_lines=1000
+        )
+
     def _create_tree_view_controls(self, parent_frame: ctk.CTkFrame) -> dict:
         """Generate and return a dictionary of tree view control buttons."""
         btn_frame = self._construct_frame(parent_frame, row=0, column=0, padx=(10, 10), pady=(10, 0), sticky="nsew")
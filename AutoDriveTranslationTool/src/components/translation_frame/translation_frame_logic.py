@@ -1,11 +1,16 @@
 # AutoDriveTranslationTool/src/components/translation_frame/translation_frame_logic.py
 
 from GuiFramework.widgets import CustomPopupMessageBox
+from GuiFramework.utilities import FileOps
+from GuiFramework.utilities.logging import Logger
 
 from GuiFramework.utilities.config import ConfigHandler as CH
 from GuiFramework.utilities.config.config_types import ConfigKeyList as CKL
 
 from AutoDriveTranslationTool.src.functions import Translator
+from AutoDriveTranslationTool.src.functions.cpu_profile import CpuProfile, is_profiling_enabled
+from AutoDriveTranslationTool.src.utilities import BackgroundJob
+from AutoDriveTranslationTool.src.core.constants import LOGGER_NAME
 
 
 class TranslationFrameLogic:
@@ -19,21 +24,15 @@ class TranslationFrameLogic:
         self.localization_manager = self.app_instance.localization_manager
         self.loc = self.localization_manager.localize
 
+        self.translation_job = None
+        self.gui_instance.btn_cancel.configure(state="disabled")
+
     def _on_translate(self) -> None:
         """Start the translation process for selected languages."""
         def callback_handler(is_confirmed: bool) -> None:
             """Handle the confirmation callback for translation."""
             if is_confirmed:
-                Translator(
-                    input_files=self.gui_instance.input_files_tree_view.get_selected_files(),
-                    dictionaries=self.gui_instance.dictionaries_tree_view.get_selected_files(),
-                    input_path=CH.get_variable_value(CKL.INPUT_PATH),
-                    output_path=CH.get_variable_value(CKL.OUTPUT_PATH),
-                    output_widget=self.gui_instance.textbox_output_console,
-                    progress_bar=self.gui_instance.progress_bar,
-                    whole_word=CH.get_variable_value(CKL.WHOLE_WORD_REPLACEMENT),
-                    localization_manager=self.localization_manager
-                )
+                self._start_translation()
         CustomPopupMessageBox(
             self.gui_instance,
             title=self.loc("tf_cpm_start_translation_title"),
@@ -44,9 +43,59 @@ class TranslationFrameLogic:
             ]
         )
 
+    def _start_translation(self) -> None:
+        """Run the translator on a background job so the main loop keeps redrawing."""
+        if self.translation_job and self.translation_job.is_running():
+            return
+
+        # Tk variables and widgets may only be touched on the main thread, resolve everything up front.
+        log_path = FileOps.resolve_development_path(__file__, "logs", "AutoDriveTranslationTool", root_marker="AutoDriveTranslationTool")
+        translator_kwargs = {
+            "input_files": self.gui_instance.input_files_tree_view.get_selected_files(),
+            "dictionaries": self.gui_instance.dictionaries_tree_view.get_selected_files(),
+            "input_path": CH.get_variable_value(CKL.INPUT_PATH),
+            "output_path": CH.get_variable_value(CKL.OUTPUT_PATH),
+            "whole_word": CH.get_variable_value(CKL.WHOLE_WORD_REPLACEMENT).get(),
+            "localization_manager": self.localization_manager,
+            "cache_path": FileOps.join_paths(CH.get_variable_value(CKL.CACHE_PATH), "dictionaries"),
+            "workers": CH.get_variable_value(CKL.TRANSLATION_WORKERS),
+            "output_mode": CH.get_variable_value(CKL.TRANSLATION_OUTPUT_MODE),
+            "memo_size": CH.get_variable_value(CKL.TRANSLATION_MEMO_SIZE),
+            "matcher_engine": CH.get_variable_value(CKL.MATCHER_ENGINE),
+            "validation_rules": (("name", CH.get_variable_value(CKL.MAX_NAME_LENGTH)), ("group", CH.get_variable_value(CKL.MAX_GROUP_LENGTH))),
+            "stats_path": log_path
+        }
+        if is_profiling_enabled(CH.get_variable_value(CKL.ENABLE_PROFILING).get()):
+            translator_kwargs["cpu_profile"] = CpuProfile(log_path, "translate")
+
+        self.translation_job = BackgroundJob(
+            self.app_instance.window,
+            lambda job: Translator(output_widget=job.output_widget, progress_bar=job.progress_bar, cancel_event=job.cancel_event, **translator_kwargs),
+            output_widget=self.gui_instance.console_sink,
+            progress_bar=self.gui_instance.progress_bar,
+            on_done=self._on_translation_done
+        )
+        self.gui_instance.btn_translate.configure(state="disabled")
+        self.gui_instance.btn_cancel.configure(state="normal")
+        self.translation_job.start()
+
+    def _on_cancel(self) -> None:
+        """Stop the running translation after the file currently being translated."""
+        if self.translation_job:
+            self.gui_instance.btn_cancel.configure(state="disabled")
+            self.translation_job.cancel()
+
+    def _on_translation_done(self, error) -> None:
+        """Restore the buttons once the background job has finished."""
+        self.gui_instance.btn_translate.configure(state="normal")
+        self.gui_instance.btn_cancel.configure(state="disabled")
+        if error:
+            Logger.get_logger(LOGGER_NAME).log_error(f"Translation failed: {error}", module_name="TranslationFrameLogic")
+
     def _on_language_updated(self) -> None:
         """Update the localization for language-related components."""
         self.gui_instance.btn_translate.update_localization()
+        self.gui_instance.btn_cancel.update_localization()
         for button in self.gui_instance.input_files_tree_view_controls.values():
             button.update_localization()
         for button in self.gui_instance.dictionaries_tree_view_controls.values():
@@ -59,7 +108,7 @@ class TranslationFrameLogic:
     #    Validator(
     #        input_path=CH.get_variable_value(CKL.OUTPUT_PATH),
     #        languages=self.gui_instance.scroll_list_language_selection.get_checked_entries(),
-    #        output_widget=self.gui_instance.textbox_output_console,
+    #        output_widget=self.gui_instance.console_sink,
     #        localization_manager=self.localization_manager,
     #        console=False,
     #    )
@@ -75,7 +124,7 @@ class TranslationFrameLogic:
     #        output_path="missing_translations.txt",
     #        dictionary_path=CH.get_variable_value(CKL.DICTIONARIES_PATH),
     #        languages=self.gui_instance.scroll_list_language_selection.get_checked_entries(),
-    #        output_widget=self.gui_instance.textbox_output_console,
+    #        output_widget=self.gui_instance.console_sink,
     #        localization_manager=self.localization_manager,
     #        console=False,
     #    )
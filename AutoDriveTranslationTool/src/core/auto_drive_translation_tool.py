@@ -132,4 +132,5 @@ class AutoDriveTranslationTool:
             CH.save_setting(CKL.WINDOW_SIZE, f"{self.window.winfo_width()}x{self.window.winfo_height()}")
         if CH.get_variable_value(CKL.SAVE_WINDOW_POS).get():
             CH.save_setting(CKL.WINDOW_POSITION, f"{self.window.winfo_x()}+{self.window.winfo_y()}")
+        self.translation_frame.gui_instance.console_sink.close()
         self.logger.log_info("Application closed", "AutoDriveTranslationTool")
@@ -0,0 +1,297 @@
+# AutoDriveTranslationTool/src/core/cli.py
+
+import os
+import argparse
+import configparser
+
+from GuiFramework.utilities import FileOps, LocalizationManager
+from GuiFramework.utilities.logging.logger import Logger, LoggerConfig, LOG_LEVEL
+
+from AutoDriveTranslationTool.src.core.constants import APP_NAME, LOGGER_NAME, LOG_NAME
+from AutoDriveTranslationTool.src.functions import Translator, Validator, TranslationFinder
+from AutoDriveTranslationTool.src.functions.translation_worker import OUTPUT_MODES
+from AutoDriveTranslationTool.src.functions.dictionary_cache import MATCHER_ENGINES
+from AutoDriveTranslationTool.src.functions.dictionary_analyzer import DictionaryAnalyzer
+from AutoDriveTranslationTool.src.functions.memory_profile import MemoryProfile
+from AutoDriveTranslationTool.src.functions.cpu_profile import CpuProfile, is_profiling_enabled
+from AutoDriveTranslationTool.src.utilities.benchmark import BenchmarkSuite, load_results, save_results, compare_results, check_limits
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+
+def _resolve_path(*path_parts):
+    """Resolve a path relative to the AutoDriveTranslationTool folder, like ConfigSetup does."""
+    return FileOps.resolve_development_path(__file__, *path_parts, root_marker="AutoDriveTranslationTool")
+
+
+def _load_settings():
+    """Read the TranslationSettings and AppearanceSettings from the config files without Tk variables."""
+    config_path = _resolve_path("config")
+    config = configparser.ConfigParser()
+    config.read([os.path.join(config_path, "default_config.ini"), os.path.join(config_path, "custom_config.ini")], encoding='utf-8')
+    return {
+        "whole_word_replacement": config.getboolean("TranslationSettings", "whole_word_replacement", fallback=True),
+        "translation_workers": config.getint("TranslationSettings", "translation_workers", fallback=1),
+        "translation_output_mode": config.get("TranslationSettings", "translation_output_mode", fallback="tree"),
+        "translation_memo_size": config.getint("TranslationSettings", "translation_memo_size", fallback=50000),
+        "matcher_engine": config.get("TranslationSettings", "matcher_engine", fallback="regex"),
+        "enable_profiling": config.getboolean("TranslationSettings", "enable_profiling", fallback=False),
+        "validation_rules": (
+            ("name", config.getint("TranslationSettings", "max_name_length", fallback=30)),
+            ("group", config.getint("TranslationSettings", "max_group_length", fallback=20))
+        ),
+        "ui_language": config.get("AppearanceSettings", "ui_language", fallback="English"),
+    }
+
+
+def _create_parser(settings):
+    """Create the argument parser for the translate, validate, find-missing, analyze-dictionaries and benchmark commands."""
+    parser = argparse.ArgumentParser(prog="python -m AutoDriveTranslationTool", description="Translate, validate and check AutoDrive course files without the GUI.")
+    parser.add_argument("--languages", help="Comma-separated languages to process (default: every language folder found).")
+    parser.add_argument("--ui-language", default=settings["ui_language"], help="Language of the console messages.")
+    parser.add_argument("--memory-profile", action="store_true", help="Trace the memory of translate, validate or find-missing in a single process and write a report to the log folder.")
+    parser.add_argument("--profile", action=argparse.BooleanOptionalAction, default=is_profiling_enabled(settings["enable_profiling"]), help="Profile translate, validate or find-missing with cProfile in a single process and write a .pstats file to the log folder.")
+    parser.set_defaults(validation_rules=settings["validation_rules"])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    translate_parser = subparsers.add_parser("translate", help="Translate all course files of the input folder.")
+    translate_parser.add_argument("--input", default=_resolve_path("_input"), help="Folder with the course files to translate.")
+    translate_parser.add_argument("--output", default=_resolve_path("_output"), help="Folder the translated course files are written to.")
+    translate_parser.add_argument("--dictionaries", default=_resolve_path("_dictionaries"), help="Folder with one sub folder of .dic files per language.")
+    translate_parser.add_argument("--cache", default=os.path.join(_resolve_path("_cache"), "dictionaries"), help="Folder of the compiled dictionary cache, only used by the trie matcher engine.")
+    translate_parser.add_argument("--whole-word", action=argparse.BooleanOptionalAction, default=settings["whole_word_replacement"], help="Only replace whole words.")
+    translate_parser.add_argument("--workers", type=int, default=settings["translation_workers"], help="Number of worker processes (0 = one per CPU).")
+    translate_parser.add_argument("--output-mode", choices=list(OUTPUT_MODES), default=settings["translation_output_mode"], help="How the translated files are written.")
+    translate_parser.add_argument("--matcher-engine", choices=list(MATCHER_ENGINES), default=settings["matcher_engine"], help="Dictionary matcher used with whole word replacement.")
+    translate_parser.add_argument("--memo-size", type=int, default=settings["translation_memo_size"], help="Marker texts kept in the translation memo (0 = off).")
+    translate_parser.add_argument("--force", action="store_true", help="Rewrite every output, even if it is up to date.")
+    translate_parser.add_argument("--dry-run", metavar="REPORT", help="Write no course file, only a CSV report of every marker text the translation would change.")
+    translate_parser.add_argument("--stats", default=_resolve_path("logs", "AutoDriveTranslationTool"), help="Folder the statistics of every file are written to as translation_stats.json and .csv.")
+
+    validate_parser = subparsers.add_parser("validate", help="Check the translated files against AutoDrive's length limits.")
+    validate_parser.add_argument("--output", default=_resolve_path("_output"), help="Folder with one sub folder of translated files per language.")
+    validate_parser.add_argument("--workers", type=int, default=settings["translation_workers"], help="Number of worker processes (0 = one per CPU).")
+
+    find_missing_parser = subparsers.add_parser("find-missing", help="List words of the course files that have no translation.")
+    find_missing_parser.add_argument("--input", default=_resolve_path("_input"), help="Folder with the course files to check.")
+    find_missing_parser.add_argument("--dictionaries", default=_resolve_path("_dictionaries"), help="Folder with the dictionaries.")
+    find_missing_parser.add_argument("--report", default=_resolve_path("_output", "missing_translations.txt"), help="File the ranked missing words are written to.")
+    find_missing_parser.add_argument("--suggestions", type=int, default=3, help="Closest existing dictionary entries shown per missing word (0 = off).")
+    find_missing_parser.add_argument("--coverage", action="store_true", help="Run the translator's dictionaries and report the text spans they leave untranslated.")
+    find_missing_parser.add_argument("--whole-word", action=argparse.BooleanOptionalAction, default=settings["whole_word_replacement"], help="Only match whole words (coverage mode).")
+    find_missing_parser.add_argument("--matcher-engine", choices=list(MATCHER_ENGINES), default=settings["matcher_engine"], help="Dictionary matcher used with whole word replacement (coverage mode).")
+    find_missing_parser.add_argument("--cache", default=os.path.join(_resolve_path("_cache"), "dictionaries"), help="Folder of the compiled dictionary cache (coverage mode), only used by the trie matcher engine.")
+
+    analyze_parser = subparsers.add_parser("analyze-dictionaries", help="Report duplicate, conflicting and shadowed dictionary entries.")
+    analyze_parser.add_argument("--dictionaries", default=_resolve_path("_dictionaries"), help="Folder with one sub folder of .dic files per language.")
+    analyze_parser.add_argument("--report", default=_resolve_path("_output", "dictionary_analysis.txt"), help="File the full analysis is written to.")
+    analyze_parser.add_argument("--whole-word", action=argparse.BooleanOptionalAction, default=settings["whole_word_replacement"], help="Only count whole words as shadowing.")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="Time the translation functions on a generated corpus.")
+    benchmark_parser.add_argument("--work", default=_resolve_path("_cache", "benchmark"), help="Folder the corpus is generated in, replaced on every run.")
+    benchmark_parser.add_argument("--output", default=_resolve_path("_output", "benchmark.json"), help="File the results are written to.")
+    benchmark_parser.add_argument("--baseline", help="Results file to compare against; regressions make the command fail.")
+    benchmark_parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed slowdown or memory growth against the baseline (0.1 = 10%%).")
+    benchmark_parser.add_argument("--files", type=int, default=20, help="Number of generated course files.")
+    benchmark_parser.add_argument("--waypoints", type=int, default=5000, help="Waypoints per course file.")
+    benchmark_parser.add_argument("--markers", type=int, default=200, help="Map markers per course file.")
+    benchmark_parser.add_argument("--dictionary-entries", type=int, default=2000, help="Entries of the generated dictionary.")
+    benchmark_parser.add_argument("--suggestion-entries", type=int, default=10000, help="Entries of the index suggestions are looked up in.")
+    benchmark_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per function, the fastest is reported.")
+    return parser
+
+
+def _find_files(root_path, extension):
+    """Return sorted (file_name, file_path) pairs of all files with the extension below root_path."""
+    found_files = []
+    for root, _, files in os.walk(root_path):
+        for file in files:
+            if file.endswith(extension):
+                found_files.append((file, os.path.join(root, file)))
+    return sorted(found_files, key=lambda item: item[1])
+
+
+def _find_languages(root_path):
+    """Return the language sub folders of root_path."""
+    if not os.path.isdir(root_path):
+        return []
+    return sorted(entry.name for entry in os.scandir(root_path) if entry.is_dir() and not entry.name.startswith('.'))
+
+
+def _get_memory_profile(args):
+    return MemoryProfile(_resolve_path("logs", "AutoDriveTranslationTool"), args.command) if args.memory_profile else None
+
+
+def _get_cpu_profile(args):
+    return CpuProfile(_resolve_path("logs", "AutoDriveTranslationTool"), args.command) if args.profile else None
+
+
+def _get_languages(args, root_path):
+    return args.languages.split(',') if args.languages else _find_languages(root_path)
+
+
+def _translate(args, localization_manager):
+    languages = _get_languages(args, args.dictionaries)
+    input_files = _find_files(args.input, ".xml")
+    dictionaries = [dictionary for language in languages for dictionary in _find_files(os.path.join(args.dictionaries, language), ".dic")]
+    translator = Translator(
+        input_files=list(input_files),
+        dictionaries=dictionaries,
+        input_path=args.input,
+        output_path=args.output,
+        console_output=True,
+        whole_word=args.whole_word,
+        localization_manager=localization_manager,
+        cache_path=args.cache,
+        workers=args.workers,
+        output_mode=args.output_mode,
+        memo_size=args.memo_size,
+        incremental=not args.force,
+        validation_rules=args.validation_rules,
+        matcher_engine=args.matcher_engine,
+        memory_profile=_get_memory_profile(args),
+        cpu_profile=_get_cpu_profile(args),
+        stats_path=args.stats,
+        dry_run_report=args.dry_run
+    )
+    if translator.stats.total_files_translated != len(input_files) or translator.error_count:
+        return EXIT_FAILURE
+    return EXIT_SUCCESS
+
+
+def _validate(args, localization_manager):
+    validator = Validator(
+        input_path=args.output,
+        languages=_get_languages(args, args.output),
+        localization_manager=localization_manager,
+        logger=Logger.get_logger(LOGGER_NAME),
+        console=True,
+        workers=args.workers,
+        validation_rules=args.validation_rules,
+        memory_profile=_get_memory_profile(args),
+        cpu_profile=_get_cpu_profile(args)
+    )
+    return EXIT_FAILURE if validator.error_count else EXIT_SUCCESS
+
+
+def _find_missing(args, localization_manager):
+    TranslationFinder(
+        input_path=args.input,
+        output_path=args.report,
+        dictionary_path=args.dictionaries,
+        languages=_get_languages(args, args.dictionaries),
+        localization_manager=localization_manager,
+        console=True,
+        logger=Logger.get_logger(LOGGER_NAME),
+        coverage=args.coverage,
+        whole_word=args.whole_word,
+        cache_path=args.cache,
+        suggestions=args.suggestions,
+        matcher_engine=args.matcher_engine,
+        memory_profile=_get_memory_profile(args),
+        cpu_profile=_get_cpu_profile(args)
+    )
+    return EXIT_SUCCESS
+
+
+def _analyze_dictionaries(args, localization_manager):
+    loc = localization_manager.localize_with_params
+    report_lines = []
+    conflict_count = 0
+
+    def _location(entry):
+        return f"{os.path.relpath(entry.dictionary_path, args.dictionaries)}:{entry.line_number}"
+
+    for language in _get_languages(args, args.dictionaries):
+        dictionary_paths = [dictionary_path for _, dictionary_path in _find_files(os.path.join(args.dictionaries, language), ".dic")]
+        analyzer = DictionaryAnalyzer(dictionary_paths, args.whole_word)
+        duplicates, conflicts, shadowed = analyzer.duplicates(), analyzer.conflicts(), analyzer.shadowed()
+        conflict_count += len(conflicts)
+        print(loc("dan_language_summary", language, len(analyzer), len(dictionary_paths), len(duplicates), len(conflicts), len(shadowed)))
+
+        report_lines.append(f"[{language}]")
+        for group in conflicts:
+            definitions = ', '.join(f"'{entry.target_text}' ({_location(entry)})" for entry in group)
+            print(loc("dan_conflict", group[-1].source_text, definitions, group[-1].target_text))
+            report_lines.append(f"conflict,{group[-1].source_text}," + ';'.join(f"{entry.target_text}@{_location(entry)}" for entry in group))
+        for group in duplicates:
+            report_lines.append(f"duplicate,{group[-1].source_text}," + ';'.join(_location(entry) for entry in group))
+        for entry, shadowing_entries in shadowed:
+            report_lines.append(f"shadowed,{entry.source_text}," + ';'.join(shadowing_entry.source_text for shadowing_entry in shadowing_entries))
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as report_file:
+        report_file.writelines(f"{line}\n" for line in report_lines)
+    print(loc("dan_report_written", args.report))
+    return EXIT_FAILURE if conflict_count else EXIT_SUCCESS
+
+
+def _benchmark(args, localization_manager):
+    loc = localization_manager.localize_with_params
+    suite = BenchmarkSuite(
+        work_path=args.work,
+        localization_manager=localization_manager,
+        languages=args.languages.split(',') if args.languages else ("English", "French"),
+        file_count=args.files,
+        waypoint_count=args.waypoints,
+        mapmarker_count=args.markers,
+        dictionary_size=args.dictionary_entries,
+        suggestion_size=args.suggestion_entries,
+        repeat=args.repeat
+    )
+    results = suite.run()
+    for name, benchmark in results["benchmarks"].items():
+        markers_per_second = f"{benchmark['markers_per_second']:.0f}" if benchmark["markers_per_second"] is not None else "-"
+        print(loc("bench_result", name, benchmark["seconds"], benchmark["files_per_second"], markers_per_second, benchmark["megabytes_per_second"], benchmark["peak_memory_bytes"] / 1024 / 1024))
+    save_results(args.output, results)
+    print(loc("bench_results_written", args.output))
+
+    exceeded = check_limits(results)
+    for name, metric, value, limit in exceeded:
+        print(loc("bench_limit_exceeded", name, metric, value, limit))
+    if not args.baseline:
+        return EXIT_FAILURE if exceeded else EXIT_SUCCESS
+    regressions = compare_results(results, load_results(args.baseline), args.tolerance)
+    for name, metric, value, baseline_value, ratio in regressions:
+        print(loc("bench_regression", name, metric, ratio - 1, value, baseline_value))
+    return EXIT_FAILURE if exceeded or regressions else EXIT_SUCCESS
+
+
+COMMANDS = {
+    "translate": _translate,
+    "validate": _validate,
+    "find-missing": _find_missing,
+    "analyze-dictionaries": _analyze_dictionaries,
+    "benchmark": _benchmark,
+}
+
+
+def main(argv=None):
+    """Run a command line command and return its exit code."""
+    settings = _load_settings()
+    args = _create_parser(settings).parse_args(argv)
+
+    logger = Logger(
+        LoggerConfig(
+            logger_name=LOGGER_NAME,
+            log_name=LOG_NAME,
+            log_directory=_resolve_path("logs", "AutoDriveTranslationTool"),
+            log_level=LOG_LEVEL.INFO,
+            module_name=APP_NAME
+        )
+    )
+    localization_manager = LocalizationManager(
+        locales_dir=_resolve_path("locales"),
+        active_language="English",
+        fallback_language="English",
+        lazy_load=True,
+    )
+    localization_manager.set_active_language(args.ui_language)
+
+    try:
+        return COMMANDS[args.command](args, localization_manager)
+    except Exception as e:
+        logger.log_error(f"An error occurred: {str(e)}", "cli")
+        print(f"ERROR: {e}")
+        return EXIT_FAILURE
@@ -4,3 +4,4 @@ from .translator import Translator
 from .find_missing_translations import TranslationFinder
 from .validate_output_files import Validator
 from .dictionary_creator import DictionaryCreator
+from .dictionary_matcher import DictionaryMatcher
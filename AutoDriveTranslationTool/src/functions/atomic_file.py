@@ -0,0 +1,170 @@
+# AutoDriveTranslationTool/src/functions/atomic_file.py
+
+import os
+import shutil
+import hashlib
+import tempfile
+
+
+def _get_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Permissions of a newly created file, mkstemp would leave temporary files readable by the owner only.
+_NEW_FILE_MODE = 0o666 & ~_get_umask()
+
+
+def hash_file(file_path):
+    """Return the SHA-256 hex digest of a file's content."""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def has_content(file_path, data, chunk_size=1024 * 1024):
+    """Return True if the file at file_path exists and holds exactly data, comparing chunk by chunk."""
+    try:
+        if os.path.getsize(file_path) != len(data):
+            return False
+        with open(file_path, 'rb') as file, memoryview(data) as view:
+            position = 0
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                if view[position:position + len(chunk)] != chunk:
+                    return False
+                position += len(chunk)
+        return True
+    except OSError:
+        return False
+
+
+def _get_file_mode(file_path):
+    """Return the permissions a file written to file_path should get: those of the file it replaces, else the default."""
+    try:
+        return os.stat(file_path).st_mode & 0o7777
+    except OSError:
+        return _NEW_FILE_MODE
+
+
+class AtomicFile:
+    """Binary file written next to its destination and renamed over it when closed without an error.
+
+    An interrupted write never leaves a truncated file behind. With skip_unchanged, the content hash is
+    compared with the existing file and an identical file is left untouched, keeping its modification time.
+    """
+
+    def __init__(self, file_path, skip_unchanged=True):
+        """Open a temporary file in the directory of file_path, creating the directory if needed.
+
+        Content that is complete in memory is better compared with has_content() before, as write_if_changed() does;
+        skip_unchanged is for content that is streamed and only known once it has been written.
+        """
+        self.file_path = file_path
+        self.skip_unchanged = skip_unchanged
+        self.changed = None
+        output_dir_path = os.path.dirname(file_path) or "."
+        os.makedirs(output_dir_path, exist_ok=True)
+        file_descriptor, self.temp_file_path = tempfile.mkstemp(dir=output_dir_path, suffix=".tmp")
+        self.file = os.fdopen(file_descriptor, 'wb')
+        self.hasher = hashlib.sha256() if skip_unchanged else None
+        self.size = 0
+
+    def write(self, data):
+        if self.hasher is not None:
+            self.hasher.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def _is_unchanged(self):
+        try:
+            if os.path.getsize(self.file_path) != self.size:
+                return False
+            return hash_file(self.file_path) == self.hasher.hexdigest()
+        except OSError:
+            return False
+
+    def commit(self):
+        """Replace the destination with the written content; return False if it was identical and left untouched."""
+        self.file.close()
+        try:
+            if self.skip_unchanged and self._is_unchanged():
+                os.remove(self.temp_file_path)
+                self.changed = False
+                return False
+            os.chmod(self.temp_file_path, _get_file_mode(self.file_path))
+            os.replace(self.temp_file_path, self.file_path)
+        except BaseException:
+            self.discard()
+            raise
+        self.changed = True
+        return True
+
+    def discard(self):
+        """Drop the written content and leave the destination as it was."""
+        self.file.close()
+        if os.path.exists(self.temp_file_path):
+            os.remove(self.temp_file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+
+class NullFile:
+    """Binary file that drops everything written to it, standing in for an AtomicFile in dry runs."""
+
+    def write(self, data):
+        return len(data)
+
+    def discard(self):
+        pass
+
+
+def write_if_changed(file_path, data):
+    """Write data to file_path atomically unless the file already holds exactly data; return False if it was left untouched."""
+    if has_content(file_path, data):
+        return False
+    with AtomicFile(file_path, skip_unchanged=False) as file:
+        file.write(data)
+    return True
+
+
+def link_or_copy(source_file_path, file_path):
+    """Make file_path a hard link of source_file_path, or an atomic copy where hard links are not supported.
+
+    Return False if file_path already had the same content and was left untouched.
+    """
+    try:
+        if os.path.samefile(source_file_path, file_path):
+            return False
+    except OSError:
+        pass
+    if os.path.exists(file_path) and os.path.getsize(file_path) == os.path.getsize(source_file_path) and hash_file(file_path) == hash_file(source_file_path):
+        return False
+
+    output_dir_path = os.path.dirname(file_path) or "."
+    os.makedirs(output_dir_path, exist_ok=True)
+    # The link is created under a temporary name and renamed, so the destination is replaced atomically.
+    temp_file_path = os.path.join(output_dir_path, f".{os.path.basename(file_path)}.{os.getpid()}.link.tmp")
+    try:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        os.link(source_file_path, temp_file_path)
+        os.replace(temp_file_path, file_path)
+        return True
+    except OSError:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+
+    with open(source_file_path, 'rb') as source_file, AtomicFile(file_path, skip_unchanged=False) as file:
+        shutil.copyfileobj(source_file, file)
+    return True
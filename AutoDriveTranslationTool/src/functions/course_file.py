@@ -0,0 +1,78 @@
+# AutoDriveTranslationTool/src/functions/course_file.py
+
+import io
+import xml.etree.ElementTree as ET
+
+from AutoDriveTranslationTool.src.functions.atomic_file import write_if_changed
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes, PHASE_WRITE
+
+
+class CourseFile:
+    """AutoDrive course parsed once and written out once per language."""
+
+    MARKER_TAGS = ('name', 'group')
+
+    def __init__(self, input_file_path, dry_run=False):
+        """Parse the course and collect the name and group elements of its map markers; a dry_run writes nothing."""
+        self.input_file_path = input_file_path
+        self.dry_run = dry_run
+        self.tree = ET.parse(input_file_path)
+
+        # Tag of the map marker (mm1, mm2, ...) per name and group element.
+        marker_elements = {}
+        for mapmarker in self.tree.getroot().iter('mapmarker'):
+            for mm in mapmarker:
+                for tag in self.MARKER_TAGS:
+                    element = mm.find(tag)
+                    if element is not None and element.text:
+                        marker_elements[element] = mm.tag
+        # (element, text, newlines written before the text, marker tag) of every marker text, in document order.
+        self.markers = []
+        self._find_markers(self.tree.getroot(), marker_elements, 0)
+
+    def _find_markers(self, element, marker_elements, newlines):
+        """Append the markers below element to self.markers and return the newlines written up to its end tag.
+
+        Newlines are only written as part of texts and tails; the declaration and comments are not written.
+        """
+        if element in marker_elements:
+            self.markers.append((element, element.text, newlines, marker_elements[element]))
+        if element.text:
+            newlines += element.text.count('\n')
+        for child in element:
+            newlines = self._find_markers(child, marker_elements, newlines)
+            if child.tail:
+                newlines += child.tail.count('\n')
+        return newlines
+
+    def write(self, output_file_path, translated_texts):
+        """Write the course with one translated text per map marker, in marker order; return False if the file already had this content."""
+        for (element, _, _, _), translated_text in zip(self.markers, translated_texts):
+            element.text = translated_text
+        # The tree is in memory anyway, so is its serialization; an unchanged output is detected without touching the disk.
+        content = io.BytesIO()
+        self.tree.write(content, encoding='utf-8')
+        return write_if_changed(output_file_path, content.getbuffer())
+
+    def translate(self, output_file_paths, translate_text, phase_times=None):
+        """Write the course once per language, translating every map marker text with translate_text.
+
+        translate_text gets the tag of the map marker and the line the text is written at, which moves with the newlines of earlier translations.
+        Return the number of outputs that already had the translated content and were left untouched.
+        """
+        phase_times = phase_times if phase_times is not None else PhaseTimes()
+        unchanged_outputs = 0
+        for language, output_file_path in output_file_paths.items():
+            translated_texts = []
+            added_newlines = 0
+            for element, text, newlines, marker in self.markers:
+                translated_text = translate_text(language, marker, element.tag, text, 1 + newlines + added_newlines)
+                added_newlines += translated_text.count('\n') - text.count('\n')
+                translated_texts.append(translated_text)
+            if self.dry_run:
+                continue
+            start = phase_times.start()
+            if not self.write(output_file_path, translated_texts):
+                unchanged_outputs += 1
+            phase_times.stop(PHASE_WRITE, start, language)
+        return unchanged_outputs
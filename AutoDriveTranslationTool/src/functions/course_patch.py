@@ -0,0 +1,168 @@
+# AutoDriveTranslationTool/src/functions/course_patch.py
+
+import os
+import re
+import mmap
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from xml.sax.saxutils import escape, unescape
+
+from AutoDriveTranslationTool.src.functions.atomic_file import AtomicFile, link_or_copy
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes, PHASE_PARSE, PHASE_WRITE
+
+
+class PatchedCourseFile:
+    """AutoDrive course written as a splice of untouched input bytes and translated map marker texts.
+
+    No tree is built: the input is only checked for well-formedness by expat without any handlers, and everything
+    outside the name/group texts of map markers, including the XML declaration and formatting, is copied verbatim.
+    """
+
+    MAPMARKER_START = re.compile(rb'<mapmarker[\s>]')
+    MAPMARKER_END = b'</mapmarker>'
+    MARKER_PATTERN = re.compile(rb'<(name|group)>([^<]*)</\1>')
+    # Start, end and empty element tags; comments, CDATA sections and processing instructions do not match.
+    MARKER_TAGS = (b'name', b'group')
+    TAG_PATTERN = re.compile(rb'<(/?)([A-Za-z_][\w.:-]*)[^<>]*?(/?)>')
+    ENCODING_PATTERN = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)["\']')
+    CHARACTER_REFERENCE_PATTERN = re.compile(r'&#(x[0-9a-fA-F]+|[0-9]+);')
+
+    def __init__(self, input_file_path, dry_run=False):
+        """Initialize the course; a dry_run translates the spans without writing them."""
+        self.input_file_path = input_file_path
+        self.dry_run = dry_run
+
+    def translate(self, output_file_paths, translate_text, phase_times=None):
+        """Write every language as a splice of the memory-mapped input and the translated texts.
+
+        An output without any translation is a hard link of the input. translate_text gets the line of the text
+        in the output, its input line moved by the newlines that earlier replacements add or remove, and the tag of
+        the map marker.
+        Return the number of outputs that already had the translated content and were left untouched.
+        """
+        phase_times = phase_times if phase_times is not None else PhaseTimes()
+        unchanged_outputs = 0
+        with open(self.input_file_path, 'rb') as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                raise ET.ParseError("no element found: line 1, column 0")
+            with mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                encoding = self._get_encoding(mapped_file)
+                start = phase_times.start()
+                self._check_well_formed(mapped_file)
+                spans = self._find_marker_spans(mapped_file, encoding)
+                phase_times.stop(PHASE_PARSE, start)
+                with memoryview(mapped_file) as view:
+                    for language, output_file_path in output_file_paths.items():
+                        replacements = []
+                        added_newlines = 0
+                        for start, end, line, marker, tag, text in spans:
+                            translated_text = translate_text(language, marker, tag, text, line + added_newlines)
+                            if translated_text != text:
+                                data = escape(translated_text).encode(encoding, 'xmlcharrefreplace')
+                                replacements.append((start, end, data))
+                                added_newlines += data.count(b'\n') - mapped_file[start:end].count(b'\n')
+                        if self.dry_run:
+                            continue
+                        start = phase_times.start()
+                        if replacements:
+                            changed = self._write_spliced(view, replacements, output_file_path)
+                        else:
+                            changed = link_or_copy(self.input_file_path, output_file_path)
+                        if not changed:
+                            unchanged_outputs += 1
+                        phase_times.stop(PHASE_WRITE, start, language)
+        return unchanged_outputs
+
+    def _get_encoding(self, data):
+        """Return the encoding named in the XML declaration, or utf-8."""
+        encoding_match = self.ENCODING_PATTERN.match(data, 0, 512)
+        return encoding_match.group(1).decode('ascii') if encoding_match else 'utf-8'
+
+    @staticmethod
+    def _check_well_formed(mapped_file, chunk_size=1024 * 1024):
+        """Raise ET.ParseError if the input is not well-formed XML, feeding expat at most chunk_size bytes at a time."""
+        parser = expat.ParserCreate()
+        try:
+            for chunk_start in range(0, len(mapped_file), chunk_size):
+                parser.Parse(mapped_file[chunk_start:chunk_start + chunk_size], False)
+            parser.Parse(b'', True)
+        except expat.ExpatError as e:
+            error = ET.ParseError(f"{expat.ErrorString(e.code)}: line {e.lineno}, column {e.offset}")
+            error.code, error.position = e.code, (e.lineno, e.offset)
+            raise error from None
+
+    def _find_marker_spans(self, mapped_file, encoding):
+        """Return (start, end, line, marker, tag, text) for the name/group texts of the map markers in all mapmarker elements.
+
+        Like CourseFile, only the first name and the first group child of every marker (mm1, mm2, ...) count.
+        """
+        spans = []
+        position = 0
+        line, line_position = 1, 0
+        while True:
+            section_start = self.MAPMARKER_START.search(mapped_file, position)
+            if section_start is None:
+                break
+            section_end = mapped_file.find(self.MAPMARKER_END, section_start.end())
+            if section_end == -1:
+                section_end = len(mapped_file)
+
+            open_tags = []
+            found_tags = set()
+            tag_position = section_start.end()
+            while True:
+                tag_match = self.TAG_PATTERN.search(mapped_file, tag_position, section_end)
+                if tag_match is None:
+                    break
+                tag_position = tag_match.end()
+                closing, name, empty = tag_match.groups()
+                if closing:
+                    if open_tags:
+                        open_tags.pop()
+                    continue
+                if len(open_tags) == 1 and name in self.MARKER_TAGS and name not in found_tags:
+                    found_tags.add(name)
+                    match = None if empty else self.MARKER_PATTERN.match(mapped_file, tag_match.start(), section_end)
+                    if match:
+                        tag_position = match.end()
+                        if match.end(2) > match.start(2):
+                            text = self._unescape(match.group(2).decode(encoding))
+                            line += self._count_newlines(mapped_file, line_position, match.start(2))
+                            line_position = match.start(2)
+                            spans.append((match.start(2), match.end(2), line, open_tags[0].decode(encoding), name.decode('ascii'), text))
+                        continue
+                if empty:
+                    continue
+                if not open_tags:
+                    found_tags = set()
+                open_tags.append(name)
+            position = section_end + len(self.MAPMARKER_END)
+        return spans
+
+    @staticmethod
+    def _count_newlines(mapped_file, start, end, chunk_size=1024 * 1024):
+        """Return the number of newlines between start and end, copying at most chunk_size bytes at a time."""
+        newlines = 0
+        for chunk_start in range(start, end, chunk_size):
+            newlines += mapped_file[chunk_start:min(chunk_start + chunk_size, end)].count(b'\n')
+        return newlines
+
+    def _unescape(self, text):
+        """Resolve the predefined XML entities and character references of a text node."""
+        if '&' not in text:
+            return text
+        text = self.CHARACTER_REFERENCE_PATTERN.sub(lambda match: chr(int(match.group(1)[1:], 16) if match.group(1)[0] == 'x' else int(match.group(1))), text)
+        return unescape(text, {"&quot;": '"', "&apos;": "'"})
+
+    @staticmethod
+    def _write_spliced(view, replacements, output_file_path):
+        """Write the input with the given (start, end, data) replacements applied, atomically; return False if the file already had this content."""
+        with AtomicFile(output_file_path) as output_file:
+            position = 0
+            for start, end, data in replacements:
+                output_file.write(view[position:start])
+                output_file.write(data)
+                position = end
+            output_file.write(view[position:])
+        return output_file.changed
+
@@ -0,0 +1,159 @@
+# AutoDriveTranslationTool/src/functions/course_stream.py
+
+import xml.sax
+from xml.sax.handler import ContentHandler
+from xml.sax.saxutils import escape
+
+from AutoDriveTranslationTool.src.functions.atomic_file import AtomicFile, NullFile
+from AutoDriveTranslationTool.src.functions.course_file import CourseFile
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes, PHASE_WRITE
+
+
+class _LineCountingFile:
+    """Binary file wrapper counting the lines written through it."""
+
+    def __init__(self, file):
+        self.file = file
+        self.line = 1
+
+    def write(self, data):
+        self.line += data.count(b'\n')
+        return self.file.write(data)
+
+
+class _TreeStyleWriter:
+    """Write SAX events to a binary file the way ElementTree.write serializes a parsed course with utf-8.
+
+    Empty elements are written as <tag />, attributes in double quotes with ElementTree's escaping and no XML
+    declaration is written, so stream and tree mode produce the same bytes.
+    """
+
+    ATTRIBUTE_ENTITIES = {'"': "&quot;", '\r': "&#13;", '\n': "&#10;", '\t': "&#09;"}
+
+    def __init__(self, file):
+        self.file = file
+        self.start_tag_open = False
+
+    def _write(self, text):
+        self.file.write(text.encode('utf-8'))
+
+    def _close_start_tag(self):
+        if self.start_tag_open:
+            self._write('>')
+            self.start_tag_open = False
+
+    def startElement(self, name, attrs):
+        self._close_start_tag()
+        self._write(f'<{name}' + ''.join(f' {attribute}="{escape(value, self.ATTRIBUTE_ENTITIES)}"' for attribute, value in attrs.items()))
+        self.start_tag_open = True
+
+    def endElement(self, name):
+        if self.start_tag_open:
+            self._write(' />')
+            self.start_tag_open = False
+        else:
+            self._write(f'</{name}>')
+
+    def characters(self, content):
+        if content:
+            self._close_start_tag()
+            self._write(escape(content))
+
+
+class _StreamingTranslationHandler(ContentHandler):
+    """Forward SAX events to one _TreeStyleWriter per language, translating map marker texts."""
+
+    def __init__(self, writers, output_files, translate_text):
+        super().__init__()
+        self.writers = writers
+        self.output_files = output_files
+        self.translate_text = translate_text
+        self.element_path = []
+        self.marker = None
+        self.marker_tag = None
+        self.marker_text_parts = []
+        self.translated_tags = set()
+
+    # Processing instructions are not forwarded, like comments they are dropped when ElementTree parses the course.
+    def startElement(self, name, attrs):
+        for writer in self.writers.values():
+            writer.startElement(name, attrs)
+        self.element_path.append(name)
+
+        depth = len(self.element_path)
+        if depth >= 2 and self.element_path[-2] == 'mapmarker':
+            self.marker = name
+            self.translated_tags = set()
+        elif (depth >= 3 and self.element_path[-3] == 'mapmarker'
+                and name in CourseFile.MARKER_TAGS and name not in self.translated_tags):
+            # Like CourseFile, only the first name/group child of a marker is translated.
+            self.translated_tags.add(name)
+            self.marker_tag = name
+            self.marker_text_parts = []
+
+    def endElement(self, name):
+        if self.marker_tag is not None and len(self.element_path) >= 3 and self.element_path[-3] == 'mapmarker':
+            self._flush_marker_text()
+            self.marker_tag = None
+        for writer in self.writers.values():
+            writer.endElement(name)
+        self.element_path.pop()
+
+    def characters(self, content):
+        if self.marker_tag is not None:
+            self.marker_text_parts.append(content)
+            return
+        for writer in self.writers.values():
+            writer.characters(content)
+
+    def ignorableWhitespace(self, whitespace):
+        self.characters(whitespace)
+
+    def _flush_marker_text(self):
+        text = ''.join(self.marker_text_parts)
+        self.marker_text_parts = []
+        for language, writer in self.writers.items():
+            # The writers write through, so the line count is that of the output up to this text.
+            writer.characters(self.translate_text(language, self.marker, self.marker_tag, text, self.output_files[language].line) if text else text)
+
+
+class StreamingCourseFile:
+    """AutoDrive course translated in one streaming pass with bounded memory."""
+
+    def __init__(self, input_file_path, dry_run=False):
+        """Initialize the course; a dry_run streams it to a NullFile per language."""
+        self.input_file_path = input_file_path
+        self.dry_run = dry_run
+
+    def translate(self, output_file_paths, translate_text, phase_times=None):
+        """Stream the course once, writing every language while map marker texts are translated.
+
+        Parsing and writing are one pass and recorded together as the write phase of the file. translate_text
+        gets the tag of the map marker and the line of the text in the output, counted from what has been written so far.
+        Return the number of outputs that already had the translated content and were left untouched.
+        """
+        phase_times = phase_times if phase_times is not None else PhaseTimes()
+        start = phase_times.start()
+        output_files = {}
+        try:
+            for language, output_file_path in output_file_paths.items():
+                output_files[language] = NullFile() if self.dry_run else AtomicFile(output_file_path)
+
+            line_counting_files = {language: _LineCountingFile(output_file) for language, output_file in output_files.items()}
+            writers = {language: _TreeStyleWriter(output_file) for language, output_file in line_counting_files.items()}
+            xml.sax.parse(self.input_file_path, _StreamingTranslationHandler(writers, line_counting_files, translate_text))
+            if self.dry_run:
+                return 0
+
+            unchanged_outputs = 0
+            while output_files:
+                _, output_file = output_files.popitem()
+                if not output_file.commit():
+                    unchanged_outputs += 1
+            return unchanged_outputs
+        except BaseException:
+            for output_file in output_files.values():
+                output_file.discard()
+            raise
+        finally:
+            phase_times.stop(PHASE_WRITE, start)
@@ -0,0 +1,53 @@
+# AutoDriveTranslationTool/src/functions/cpu_profile.py
+
+import os
+import cProfile
+import pstats
+from datetime import datetime
+
+
+# Set to 1, true, yes or on to profile every run, e.g. in the packaged executable without touching the config.
+PROFILE_ENVIRONMENT_VARIABLE = "AUTODRIVE_TRANSLATION_PROFILE"
+
+
+def is_profiling_enabled(setting=False):
+    """Return True if profiling is enabled by the setting or the environment variable."""
+    return bool(setting) or os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class CpuProfile:
+    """Opt-in cProfile capture of a run, written as a .pstats file next to the log.
+
+    The .pstats file can be opened with pstats or a viewer like snakeviz; summary() lists the functions with the
+    highest cumulative time for the console. Worker processes are not profiled, profiled runs use a single process.
+    """
+
+    def __init__(self, report_directory, name, top_functions=20):
+        """Initialize a profile named name whose .pstats file is written to report_directory."""
+        self.report_directory = report_directory
+        self.name = name
+        self.top_functions = top_functions
+        self.profile = cProfile.Profile()
+
+    def begin(self):
+        """Start profiling."""
+        self.profile.enable()
+
+    def end(self):
+        """Stop profiling and write the .pstats file; return its path."""
+        self.profile.disable()
+        os.makedirs(self.report_directory, exist_ok=True)
+        stats_path = os.path.join(self.report_directory, f"profile_{self.name}_{datetime.now():%Y%m%d_%H%M%S}.pstats")
+        self.profile.dump_stats(stats_path)
+        return stats_path
+
+    def summary(self):
+        """Return (function, cumulative_seconds, own_seconds, calls) of the top_functions functions by cumulative time."""
+        stats = pstats.Stats(self.profile).stats
+        rows = []
+        for (file_name, line_number, function_name), (_, calls, own_time, cumulative_time, _) in stats.items():
+            # Built-in functions have no source file, cProfile reports them as "~:0(<built-in method ...>)".
+            function = function_name if file_name == "~" else f"{os.path.basename(file_name)}:{line_number}({function_name})"
+            rows.append((function, cumulative_time, own_time, calls))
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:self.top_functions]
@@ -0,0 +1,80 @@
+# AutoDriveTranslationTool/src/functions/dictionary_analyzer.py
+
+from collections import namedtuple
+
+from AutoDriveTranslationTool.src.functions.dictionary_matcher import iter_dictionary_entries
+from AutoDriveTranslationTool.src.functions.token_trie_matcher import TokenTrieMatcher
+
+
+DictionaryEntry = namedtuple('DictionaryEntry', ['source_text', 'target_text', 'dictionary_path', 'line_number'])
+
+
+class DictionaryAnalyzer:
+    """Find duplicate, conflicting and shadowed entries across all dictionary files of a language in one pass.
+
+    Entries are grouped by their case-insensitive source text, the way the matchers look them up, and the last
+    definition of a group wins, so later files and lines override earlier ones. An entry shadows every longer
+    entry that contains it: applied one after another, whichever runs first decides the result, which is why the
+    translator matches in the canonical longest-first order instead.
+    """
+
+    # Key of the group keys that end at a trie node.
+    TERMINAL = None
+
+    def __init__(self, dictionary_paths, whole_word=True):
+        """Read every entry of the dictionary files, in order."""
+        self.dictionary_paths = list(dictionary_paths)
+        self.whole_word = whole_word
+        self.groups = {}
+        for dictionary_path in self.dictionary_paths:
+            for line_number, source_text, target_text in iter_dictionary_entries(dictionary_path):
+                entry = DictionaryEntry(source_text, target_text, dictionary_path, line_number)
+                self.groups.setdefault(source_text.lower(), []).append(entry)
+
+    def __len__(self):
+        return len(self.groups)
+
+    def _units(self, source_text):
+        """Return the trie path of a source text: its tokens for whole words, else its characters."""
+        return TokenTrieMatcher.tokenize(source_text) if self.whole_word else list(source_text.lower())
+
+    def canonical_entries(self):
+        """Return the winning (source_text, target_text) entries, longest source text first."""
+        winners = sorted((group[-1] for group in self.groups.values()), key=lambda entry: (-len(entry.source_text), entry.source_text.lower(), entry.source_text))
+        return {entry.source_text: entry.target_text for entry in winners}
+
+    def duplicates(self):
+        """Return the groups that define the same translation more than once."""
+        return [group for group in self.groups.values() if len(group) > 1 and len({entry.target_text for entry in group}) == 1]
+
+    def conflicts(self):
+        """Return the groups that define different translations, the last entry of each group wins."""
+        return [group for group in self.groups.values() if len({entry.target_text for entry in group}) > 1]
+
+    def shadowed(self):
+        """Return (entry, shadowing_entries) for every entry that contains shorter entries, longest entry first."""
+        trie = {}
+        paths = {}
+        for key, group in self.groups.items():
+            paths[key] = self._units(group[-1].source_text)
+            node = trie
+            for unit in paths[key]:
+                node = node.setdefault(unit, {})
+            node.setdefault(self.TERMINAL, []).append(key)
+
+        shadowed = []
+        for key, path in paths.items():
+            shadowing_keys = []
+            for start in range(len(path)):
+                node = trie
+                for position in range(start, len(path)):
+                    node = node.get(path[position])
+                    if node is None:
+                        break
+                    # The full path from the start is the entry itself or a spelling variant of it.
+                    if self.TERMINAL in node and (start, position + 1) != (0, len(path)):
+                        shadowing_keys.extend(shadowing_key for shadowing_key in node[self.TERMINAL] if shadowing_key not in shadowing_keys)
+            if shadowing_keys:
+                shadowed.append((self.groups[key][-1], [self.groups[shadowing_key][-1] for shadowing_key in shadowing_keys]))
+        shadowed.sort(key=lambda item: (-len(item[0].source_text), item[0].source_text.lower()))
+        return shadowed
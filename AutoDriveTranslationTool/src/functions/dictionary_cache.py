@@ -0,0 +1,141 @@
+# AutoDriveTranslationTool/src/functions/dictionary_cache.py
+
+import os
+import pickle
+import hashlib
+
+from AutoDriveTranslationTool.src.functions.atomic_file import AtomicFile
+from AutoDriveTranslationTool.src.functions.dictionary_matcher import ENGINE_VERSION, DictionaryMatcher
+from AutoDriveTranslationTool.src.functions.dictionary_analyzer import DictionaryAnalyzer
+from AutoDriveTranslationTool.src.functions.token_trie_matcher import TokenTrieMatcher
+
+
+MATCHER_ENGINE_REGEX = "regex"
+MATCHER_ENGINE_TRIE = "trie"
+
+# Matcher implementations per engine; all of them expose entries, sub(text) and untranslated_spans(text).
+# The trie engine only matches whole words, without whole word replacement the regex engine is used.
+MATCHER_ENGINES = {
+    MATCHER_ENGINE_REGEX: DictionaryMatcher,
+    MATCHER_ENGINE_TRIE: TokenTrieMatcher,
+}
+
+# Engines whose matchers load from the cache faster than they are built. The token trie is plain dicts, while
+# unpickling a DictionaryMatcher compiles its alternation again and takes as long as building it from scratch.
+CACHED_MATCHER_ENGINES = (MATCHER_ENGINE_TRIE,)
+
+
+class DictionaryCache:
+    """On-disk LRU cache of built dictionary matchers, keyed by dictionary content."""
+
+    CACHE_FILE_EXTENSION = ".pickle"
+    DEFAULT_MAX_SIZE_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_path, max_size_bytes=DEFAULT_MAX_SIZE_BYTES):
+        """Initialize the cache in the given directory."""
+        self.cache_path = os.path.normpath(cache_path)
+        self.max_size_bytes = max_size_bytes
+        os.makedirs(self.cache_path, exist_ok=True)
+
+    @staticmethod
+    def compute_key(dictionary_paths, whole_word, matcher_engine=MATCHER_ENGINE_REGEX):
+        """Return the cache key for the given dictionary files, whole word flag, matcher engine and engine version."""
+        hasher = hashlib.sha256(f"engine={ENGINE_VERSION};matcher={matcher_engine};whole_word={bool(whole_word)}".encode('utf-8'))
+        for dictionary_path in dictionary_paths:
+            with open(dictionary_path, 'rb') as file:
+                hasher.update(hashlib.sha256(file.read()).digest())
+        return hasher.hexdigest()
+
+    def load(self, key):
+        """Return the cached matcher for key, or None if it is missing or stale."""
+        cache_file_path = self._get_cache_file_path(key)
+        try:
+            with open(cache_file_path, 'rb') as file:
+                engine_version, matcher = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+            self._remove(cache_file_path)
+            return None
+
+        if engine_version != ENGINE_VERSION:
+            self._remove(cache_file_path)
+            return None
+
+        # The modification time doubles as the last access time for LRU eviction.
+        try:
+            os.utime(cache_file_path)
+        except OSError:
+            pass
+        return matcher
+
+    def store(self, key, matcher):
+        """Write the matcher for key to disk and evict old entries above the size cap."""
+        with AtomicFile(self._get_cache_file_path(key), skip_unchanged=False) as file:
+            pickle.dump((ENGINE_VERSION, matcher), file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._evict()
+
+    def _get_cache_file_path(self, key):
+        return os.path.join(self.cache_path, key + self.CACHE_FILE_EXTENSION)
+
+    def _evict(self):
+        """Delete the least recently used cache files until the cache fits the size cap."""
+        cache_files = []
+        for entry in os.scandir(self.cache_path):
+            if entry.is_file() and entry.name.endswith(self.CACHE_FILE_EXTENSION):
+                stat = entry.stat()
+                cache_files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in cache_files)
+        for _, size, cache_file_path in sorted(cache_files):
+            if total_size <= self.max_size_bytes:
+                break
+            self._remove(cache_file_path)
+            total_size -= size
+
+    @staticmethod
+    def _remove(file_path):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+
+def get_matcher_engine(whole_word, matcher_engine):
+    """Return the engine that builds the matchers; without whole word replacement it is always the regex engine."""
+    if matcher_engine not in MATCHER_ENGINES:
+        raise ValueError(f"Unknown matcher engine '{matcher_engine}', expected one of: {', '.join(MATCHER_ENGINES)}")
+    return matcher_engine if whole_word else MATCHER_ENGINE_REGEX
+
+
+def open_dictionary_cache(cache_path, whole_word, matcher_engine):
+    """Return a DictionaryCache in cache_path if the matchers are built by one of CACHED_MATCHER_ENGINES, otherwise None.
+
+    Without a cache, no cache directory is created and the dictionaries are not hashed for it.
+    """
+    if not cache_path or get_matcher_engine(whole_word, matcher_engine) not in CACHED_MATCHER_ENGINES:
+        return None
+    return DictionaryCache(cache_path)
+
+
+def load_dictionary_matcher(dictionary_paths, whole_word, dictionary_cache=None, logger=None, matcher_engine=MATCHER_ENGINE_REGEX):
+    """Return (cache_key, matcher) for the merged dictionary files, building the matcher and caching it on a miss.
+
+    Only the engines of CACHED_MATCHER_ENGINES use the cache, other matchers are always built and their cache_key is None.
+    """
+    matcher_engine = get_matcher_engine(whole_word, matcher_engine)
+    if matcher_engine not in CACHED_MATCHER_ENGINES:
+        dictionary_cache = None
+    cache_key = DictionaryCache.compute_key(dictionary_paths, whole_word, matcher_engine) if dictionary_cache else None
+    matcher = dictionary_cache.load(cache_key) if dictionary_cache else None
+    if matcher is None:
+        # Canonical order: later definitions override earlier ones, longest source text first.
+        entries = DictionaryAnalyzer(dictionary_paths, whole_word).canonical_entries()
+        matcher = MATCHER_ENGINES[matcher_engine](entries, whole_word)
+        if dictionary_cache:
+            try:
+                dictionary_cache.store(cache_key, matcher)
+            except OSError as e:
+                if logger:
+                    logger.log_error(f"Error writing dictionary cache '{cache_key}': {e}", module_name='DictionaryCache')
+    return cache_key, matcher
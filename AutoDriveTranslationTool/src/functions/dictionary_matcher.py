@@ -0,0 +1,99 @@
+# AutoDriveTranslationTool/src/functions/dictionary_matcher.py
+
+import re
+
+
+# Bump whenever the pickled matcher state changes so cached matchers are rebuilt.
+ENGINE_VERSION = 2
+
+# A span is only worth reporting as untranslated if it contains a letter.
+LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+
+def iter_dictionary_entries(dictionary_path):
+    """Yield (line_number, source_text, target_text) for every entry of a single .dic file, in file order."""
+    in_comment_block = False
+    with open(dictionary_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.strip()
+            if line.startswith('###*'):
+                in_comment_block = True
+            elif line.endswith('*###'):
+                in_comment_block = False
+            if in_comment_block or not line:
+                continue
+            parts = line.split(",", maxsplit=1)
+            if len(parts) == 2:
+                yield line_number, parts[0], parts[1]
+
+
+def read_dictionary_entries(dictionary_path):
+    """Read the (source_text, target_text) entries of a single .dic file."""
+    return {source_text: target_text for _, source_text, target_text in iter_dictionary_entries(dictionary_path)}
+
+
+class DictionaryMatcher:
+    """Replace every entry of a merged dictionary in one left-to-right scan."""
+
+    def __init__(self, entries, whole_word=False):
+        """Build a single longest-first alternation from (source_text, target_text) pairs."""
+        self.entries = dict(entries)
+        self.whole_word = bool(whole_word)
+
+        # Lookup table for matched text; the first entry wins for case-insensitive duplicates.
+        self._targets = {}
+        for source_text, target_text in self.entries.items():
+            self._targets.setdefault(source_text.lower(), (source_text, target_text))
+
+        self.pattern = self._compile_pattern()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _compile_pattern(self):
+        """Compile all source texts into one case-insensitive pattern, longest entries first."""
+        if not self.entries:
+            return None
+        source_texts = sorted(self.entries, key=len, reverse=True)
+        alternation = '|'.join(re.escape(source_text) for source_text in source_texts)
+        regex_pattern = r'\b(?:' + alternation + r')\b' if self.whole_word else alternation
+        return re.compile(regex_pattern, flags=re.IGNORECASE)
+
+    def _lookup(self, matched_text):
+        """Return the (source_text, target_text) entry for a matched text."""
+        entry = self._targets.get(matched_text.lower())
+        if entry is None:
+            # Case folding of the regex engine and str.lower() differ for a few characters.
+            for source_text, target_text in self.entries.items():
+                if re.fullmatch(re.escape(source_text), matched_text, flags=re.IGNORECASE):
+                    entry = (source_text, target_text)
+                    break
+            self._targets[matched_text.lower()] = entry
+        return entry
+
+    def sub(self, text):
+        """Translate text and return it together with the source texts that fired, in match order."""
+        fired_terms = []
+        if self.pattern is None or not text:
+            return text, fired_terms
+
+        def _replace(match):
+            matched_text = match.group(0)
+            source_text, target_text = self._lookup(matched_text)
+            if target_text != matched_text and source_text not in fired_terms:
+                fired_terms.append(source_text)
+            return target_text
+
+        return self.pattern.sub(_replace, text), fired_terms
+
+    def untranslated_spans(self, text):
+        """Return the stripped parts of text that no dictionary entry matches, and the number of matched characters."""
+        spans = []
+        matched_characters = 0
+        position = 0
+        for match in (self.pattern.finditer(text) if self.pattern is not None else ()):
+            spans.append(text[position:match.start()])
+            matched_characters += match.end() - match.start()
+            position = match.end()
+        spans.append(text[position:])
+        return [span.strip(' -/,.;:()') for span in spans if LETTER_PATTERN.search(span)], matched_characters
@@ -1,13 +1,18 @@
 # find_missing_translations.py
 
 import os
-import re
+import csv
 from collections import defaultdict
 from src.utilities.func_helpers import output
+from src.functions.profiled_run import ProfiledRunMixin
+from src.functions.term_index import TermIndex
+from src.functions.suggestion_index import SuggestionIndex
+from src.functions.dictionary_matcher import read_dictionary_entries
+from src.functions.dictionary_cache import open_dictionary_cache, load_dictionary_matcher, MATCHER_ENGINE_REGEX
 
 
-class TranslationFinder:
-    def __init__(self, input_path, output_path, dictionary_path, languages, output_widget=None, localization_manager=None, console=False, logger=None):
+class TranslationFinder(ProfiledRunMixin):
+    def __init__(self, input_path, output_path, dictionary_path, languages, output_widget=None, localization_manager=None, console=False, logger=None, coverage=False, whole_word=False, cache_path=None, suggestions=3, matcher_engine=MATCHER_ENGINE_REGEX, memory_profile=None, cpu_profile=None):
         self.input_path = os.path.normpath(input_path)
         self.output_path = os.path.normpath(output_path)
         self.dictionary_path = os.path.normpath(dictionary_path)
@@ -17,58 +22,149 @@ class TranslationFinder:
         self.loc = localization_manager.localize
         self.loc_param = localization_manager.localize_with_params
         self.logger = logger
+        self.whole_word = whole_word
+        self.dictionary_cache = open_dictionary_cache(cache_path, whole_word, matcher_engine) if coverage else None
+        self.suggestions = suggestions
+        self.matcher_engine = matcher_engine
+        self.memory_profile = memory_profile
+        self.cpu_profile = cpu_profile
 
-        self._find_missing_translations()
+        with self._profiled_run():
+            if coverage:
+                self._find_untranslated_spans()
+            else:
+                self._find_missing_translations()
 
     def _output(self, message, loc_params=None, message_type=""):
         output(message, message_type, self.loc, self.output_widget, self.console, self.loc_param, loc_params, self.logger)
 
     def _load_translations(self):
-        translations = defaultdict(set)
+        translations = defaultdict(dict)
         for language in self.languages:
-            dictionary_file = self._get_dictionary_file(language)
-            try:
-                with open(dictionary_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if ',' in line:
-                            word, _ = line.strip().split(',')
-                            translations[language].add(word)
-            except FileNotFoundError:
-                self._output("fmt_dictionary_not_found", (language), "error")
+            for dictionary_file in self._get_dictionary_files(language):
+                translations[language].update(read_dictionary_entries(dictionary_file))
         return translations
 
+    def _report_term(self, report_rows, suggestion_index, term, occurrences, file_count):
+        """Output a missing term with its closest existing dictionary entries and add it to the report."""
+        self._output("fmt_missing_term", (term, occurrences, file_count))
+        suggestions = suggestion_index.suggest(term, self.suggestions) if suggestion_index else []
+        for source_text, target_text, similarity in suggestions:
+            self._output("fmt_suggestion", (source_text, target_text, similarity))
+        report_rows.append((term, occurrences, file_count, ';'.join(f"{source_text}={target_text}" for source_text, target_text, _ in suggestions)))
+
+    def _write_report(self, report_rows):
+        """Write the report as CSV, so terms containing commas or quotes keep their column."""
+        os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
+        with open(self.output_path, 'w', encoding='utf-8', newline='') as report_file:
+            csv.writer(report_file).writerows(report_rows)
+        self._output("fmt_report_written", (self.output_path))
+
+    def _get_dictionary_files(self, language):
+        """Return the legacy Dictionary_<language>.dic file, or else every .dic file of the language folder the translator uses."""
+        dictionary_file = self._get_dictionary_file(language)
+        language_path = os.path.join(self.dictionary_path, language)
+        if os.path.isfile(dictionary_file):
+            return [dictionary_file]
+        if os.path.isdir(language_path):
+            return sorted(os.path.join(root, file) for root, _, files in os.walk(language_path) for file in files if file.endswith(".dic"))
+        self._output("fmt_dictionary_not_found", (language), "error")
+        return []
+
     def _get_dictionary_file(self, language):
         dictionary_file = os.path.join(self.dictionary_path, f"Dictionary_{language}.dic")
         return dictionary_file
 
-    def _find_missing_translations_in_file(self, input_file, translations):
-        word_pattern = re.compile(r'<(?:name|group)>(.*?)</(?:name|group)>')
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        words = word_pattern.findall(content)
-        unique_words = set(word for phrase in words for word in phrase.split() if not word.isdigit() and re.search(r'[a-zA-Z]', word))
-        missing_translations = {lang: unique_words - trans for lang, trans in translations.items()}
-        return missing_translations
+    def _build_term_index(self):
+        """Index the marker words of every course file in one pass."""
+        term_index = TermIndex()
+        for root, _, files in os.walk(self.input_path):
+            for file in files:
+                if file.endswith(".xml"):
+                    file_path = os.path.join(root, file)
+                    with self._memory_file_phase(file_path, "index"):
+                        term_index.add_file(file_path)
+        return term_index
 
     def _find_missing_translations(self):
         self._output("fmt_search_missing_translations", (len(self.languages), ', '.join(self.languages)))
 
-        translations = self._load_translations()
+        with self._memory_phase("dictionary_load"):
+            translations = self._load_translations()
+        with self._memory_phase("index"):
+            term_index = self._build_term_index()
+        self._output("fmt_indexed_files", (len(term_index.files), len(term_index)))
 
-        for root, _, files in os.walk(self.input_path):
-            for file in files:
-                if file.endswith(".xml"):
-                    input_file = os.path.join(root, file)
-                    self._output("fmt_processing_file", (input_file))
-                    missing_translations = self._find_missing_translations_in_file(input_file, translations)
-
-                    for language, missing in missing_translations.items():
-                        if missing:
-                            self._output("fmt_missing_translations", (language, len(missing)))
-                            for word in sorted(missing):
-                                self._output(f"{word}")
-                        else:
-                            self._output("fmt_no_missing_translations", (language))
+        report_rows = []
+        with self._memory_phase("search"):
+            for language, entries in translations.items():
+                missing = term_index.missing_terms(entries)
+                if missing:
+                    self._output("fmt_missing_translations", (language, len(missing)))
+                    report_rows.append((f"[{language}]",))
+                    suggestion_index = SuggestionIndex(entries) if self.suggestions else None
+                    for term, occurrences, file_count in missing:
+                        self._report_term(report_rows, suggestion_index, term, occurrences, file_count)
+                else:
+                    self._output("fmt_no_missing_translations", (language))
+
+        self._write_report(report_rows)
+
+        self._output("")
+        self._output("fmt_search_finished")
+
+    def _find_untranslated_spans(self):
+        """Run the translator's compiled dictionaries over every marker text and rank the spans they leave untranslated."""
+        self._output("fmt_search_untranslated_spans", (len(self.languages), ', '.join(self.languages)))
+
+        matchers = {}
+        with self._memory_phase("dictionary_load"):
+            for language in self.languages:
+                dictionary_files = self._get_dictionary_files(language)
+                if dictionary_files:
+                    _, matchers[language] = load_dictionary_matcher(dictionary_files, self.whole_word, self.dictionary_cache, self.logger, self.matcher_engine)
+
+        span_indexes = {language: TermIndex() for language in matchers}
+        matched_characters = dict.fromkeys(matchers, 0)
+        total_characters = 0
+        # Marker texts repeat a lot across courses, every distinct text is matched once per language.
+        analyzed_texts = {}
+        file_count = 0
+        with self._memory_phase("match"):
+            for root, _, files in os.walk(self.input_path):
+                for file in files:
+                    if not file.endswith(".xml"):
+                        continue
+                    file_path = os.path.join(root, file)
+                    with self._memory_file_phase(file_path, "match"):
+                        for text in TermIndex.read_marker_texts(file_path):
+                            total_characters += len(text)
+                            for language, matcher in matchers.items():
+                                key = (language, text)
+                                if key not in analyzed_texts:
+                                    analyzed_texts[key] = matcher.untranslated_spans(text)
+                                spans, matched = analyzed_texts[key]
+                                matched_characters[language] += matched
+                                for span in spans:
+                                    span_indexes[language].add(span, file_count)
+                    file_count += 1
+
+        report_rows = []
+        with self._memory_phase("search"):
+            for language, span_index in span_indexes.items():
+                coverage = matched_characters[language] / total_characters * 100 if total_characters else 100.0
+                self._output("fmt_coverage", (language, coverage))
+                untranslated = span_index.missing_terms()
+                if untranslated:
+                    self._output("fmt_untranslated_spans", (language, len(untranslated)))
+                    report_rows.append((f"[{language}]",))
+                    suggestion_index = SuggestionIndex(matchers[language].entries) if self.suggestions else None
+                    for span, occurrences, span_file_count in untranslated:
+                        self._report_term(report_rows, suggestion_index, span, occurrences, span_file_count)
+                else:
+                    self._output("fmt_no_missing_translations", (language))
+
+        self._write_report(report_rows)
 
         self._output("")
         self._output("fmt_search_finished")
@@ -0,0 +1,185 @@
+# AutoDriveTranslationTool/src/functions/memory_profile.py
+
+import os
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes
+
+
+def _format_bytes(size):
+    return f"{size / 1024 / 1024:.2f} MB"
+
+
+# [start_memory, peak] of every running phase of any MemoryPhaseTimes, innermost last. The traced peak is process-wide
+# and reset when a phase starts, so the enclosing phase, e.g. of the run around the phases of a file, keeps its peak here.
+_running_phases = []
+
+
+class MemoryPhaseTimes(PhaseTimes):
+    """PhaseTimes that also records the traced memory of every phase while tracemalloc runs.
+
+    The peak of a phase is the highest traced memory above its start and the retained memory what is still
+    allocated when it ends. Repeated phases combine as maximum peak and summed retained memory.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.peaks = {}
+        self.retained = {}
+        # Traced memory when the first phase started, the highest traced memory and the traced memory after the last phase.
+        self.base_memory = None
+        self.highest_memory = 0
+        self.last_memory = 0
+        self._memory = []
+
+    def start(self):
+        current, peak = tracemalloc.get_traced_memory()
+        if self.base_memory is None:
+            self.base_memory = current
+        if _running_phases:
+            # Keep the peak the enclosing phase reached so far, the traced peak is reset for this phase.
+            _running_phases[-1][1] = max(_running_phases[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._memory.append([current, current])
+        _running_phases.append(self._memory[-1])
+        return super().start()
+
+    def stop(self, phase, start, language=None):
+        super().stop(phase, start, language)
+        current, peak = tracemalloc.get_traced_memory()
+        memory = self._memory.pop()
+        # Phases above this one were abandoned by an error, their peak still counts for this phase.
+        while _running_phases:
+            running = _running_phases.pop()
+            if running is memory:
+                break
+            memory[1] = max(memory[1], running[1])
+        start_memory, nested_peak = memory
+        peak = max(peak, nested_peak)
+        if _running_phases:
+            _running_phases[-1][1] = max(_running_phases[-1][1], peak)
+        self.highest_memory = max(self.highest_memory, peak)
+        self.last_memory = current
+        self.add_memory(phase, peak - start_memory, current - start_memory)
+
+    def add_memory(self, phase, peak, retained):
+        """Add the peak and retained memory of one run of a phase."""
+        self.peaks[phase] = max(self.peaks.get(phase, 0), peak)
+        self.retained[phase] = self.retained.get(phase, 0) + retained
+
+    def merge(self, other):
+        super().merge(other)
+        for phase, peak in other.peaks.items():
+            self.add_memory(phase, peak, other.retained.get(phase, 0))
+
+    @property
+    def peak(self):
+        """Return the highest traced memory above the start of the first phase."""
+        return self.highest_memory - self.base_memory if self.base_memory is not None else 0
+
+    @property
+    def retained_total(self):
+        """Return the traced memory still allocated after the last phase, above the start of the first phase."""
+        return self.last_memory - self.base_memory if self.base_memory is not None else 0
+
+
+class MemoryProfile:
+    """Opt-in tracemalloc profile of a run, written as a report next to the log.
+
+    The run is split into phases; at every phase boundary a snapshot is compared with the previous one to find
+    the allocation sites that grew the most. Files are profiled with the cheaper MemoryPhaseTimes counters only.
+    Allocations of worker processes are not traced, profiled runs use a single process.
+    """
+
+    def __init__(self, report_directory, name, frames=10, top_sites=10):
+        """Initialize a profile named name whose report is written to report_directory."""
+        self.report_directory = report_directory
+        self.name = name
+        self.frames = frames
+        self.top_sites = top_sites
+        self.phase_times = MemoryPhaseTimes()
+        self.files = {}
+        self.boundaries = []
+        self._snapshot = None
+
+    def begin(self):
+        """Start tracing allocations."""
+        tracemalloc.start(self.frames)
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        # The traces of tracemalloc and this module are bookkeeping of the profile itself.
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @contextmanager
+    def phase(self, phase):
+        """Profile a phase of the run and record the allocation sites that grew during it."""
+        start = self.phase_times.start()
+        try:
+            yield
+        finally:
+            self.phase_times.stop(phase, start)
+            snapshot = self._take_snapshot()
+            grown_sites = [statistic for statistic in snapshot.compare_to(self._snapshot, 'lineno') if statistic.size_diff > 0]
+            grown_sites.sort(key=lambda statistic: statistic.size_diff, reverse=True)
+            self.boundaries.append((phase, tracemalloc.get_traced_memory()[0], grown_sites[:self.top_sites]))
+            self._snapshot = snapshot
+
+    def add_file(self, file_name, phase_times):
+        """Record the MemoryPhaseTimes of one file."""
+        self.files[file_name] = phase_times
+
+    @contextmanager
+    def file_phase(self, file_name, phase):
+        """Profile a phase of a single file."""
+        phase_times = self.files.setdefault(file_name, MemoryPhaseTimes())
+        start = phase_times.start()
+        try:
+            yield
+        finally:
+            phase_times.stop(phase, start)
+
+    def end(self):
+        """Stop tracing and write the report; return its path."""
+        # Phases reset the traced peak, the highest memory of the run is the largest one any of them saw.
+        peak_memory = max([tracemalloc.get_traced_memory()[1], self.phase_times.highest_memory] + [phase_times.highest_memory for phase_times in self.files.values()])
+        tracemalloc.stop()
+        os.makedirs(self.report_directory, exist_ok=True)
+        created = datetime.now()
+        report_path = os.path.join(self.report_directory, f"memory_profile_{self.name}_{created:%Y%m%d_%H%M%S}.txt")
+        with open(report_path, 'w', encoding='utf-8') as report_file:
+            report_file.writelines(f"{line}\n" for line in self._report_lines(created, peak_memory))
+        return report_path
+
+    def _report_lines(self, created, peak_memory):
+        lines = [f"Memory profile: {self.name}, {created.isoformat(timespec='seconds')}", f"Peak traced memory: {_format_bytes(peak_memory)}", ""]
+
+        lines.append("Phases (peak above phase start, retained after phase, time):")
+        for phase, peak in self.phase_times.peaks.items():
+            lines.append(f"  {phase}: peak {_format_bytes(peak)}, retained {_format_bytes(self.phase_times.retained[phase])}, {self.phase_times.totals[phase] / 1e6:.1f} ms")
+
+        file_phases = MemoryPhaseTimes()
+        for phase_times in self.files.values():
+            file_phases.merge(phase_times)
+        if file_phases.peaks:
+            lines += ["", "File phases (highest peak of a file, retained summed over files, time):"]
+            for phase, peak in file_phases.peaks.items():
+                lines.append(f"  {phase}: peak {_format_bytes(peak)}, retained {_format_bytes(file_phases.retained[phase])}, {file_phases.totals[phase] / 1e6:.1f} ms")
+
+            lines += ["", "Files by peak:"]
+            for file_name, phase_times in sorted(self.files.items(), key=lambda item: item[1].peak, reverse=True):
+                phase_peaks = ', '.join(f"{phase} {_format_bytes(peak)}" for phase, peak in phase_times.peaks.items())
+                lines.append(f"  {file_name}: peak {_format_bytes(phase_times.peak)}, retained {_format_bytes(phase_times.retained_total)} ({phase_peaks})")
+
+        lines += ["", f"Top {self.top_sites} allocation sites per phase (growth since the previous phase):"]
+        for phase, traced_memory, grown_sites in self.boundaries:
+            lines.append(f"  {phase} (traced after phase: {_format_bytes(traced_memory)}):")
+            for statistic in grown_sites:
+                frame = statistic.traceback[0]
+                lines.append(f"    +{_format_bytes(statistic.size_diff)} in {statistic.count_diff:+d} blocks: {frame.filename}:{frame.lineno}")
+        return lines
@@ -0,0 +1,68 @@
+# AutoDriveTranslationTool/src/functions/phase_times.py
+
+from time import perf_counter_ns
+
+
+PHASE_DICTIONARY_LOAD = "dictionary_load"
+PHASE_PARSE = "parse"
+PHASE_SUBSTITUTE = "substitute"
+PHASE_WRITE = "write"
+
+# Display order of the phases.
+PHASES = (PHASE_DICTIONARY_LOAD, PHASE_PARSE, PHASE_SUBSTITUTE, PHASE_WRITE)
+
+
+class PhaseTimes:
+    """Nanosecond totals per phase, overall and per language.
+
+    Phases may nest, e.g. substitution inside the single pass of the streaming writer; every phase records its
+    own time without the phases nested in it, so the totals add up to the measured wall time.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.languages = {}
+        self._nested = []
+
+    def start(self):
+        """Start measuring a phase and return its start time for stop()."""
+        self._nested.append(0)
+        return perf_counter_ns()
+
+    def stop(self, phase, start, language=None):
+        """Record the phase started at start, for language if given."""
+        elapsed = perf_counter_ns() - start
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        self.add(phase, elapsed - nested, language)
+
+    def add(self, phase, duration_ns, language=None):
+        """Add a duration to a phase, for language if given."""
+        self.totals[phase] = self.totals.get(phase, 0) + duration_ns
+        if language is not None:
+            self.add_language(language, phase, duration_ns)
+
+    def merge(self, other):
+        """Add the durations of another PhaseTimes."""
+        for phase, duration_ns in other.totals.items():
+            self.totals[phase] = self.totals.get(phase, 0) + duration_ns
+        for language, language_totals in other.languages.items():
+            for phase, duration_ns in language_totals.items():
+                self.add_language(language, phase, duration_ns)
+
+    def add_language(self, language, phase, duration_ns):
+        """Add a duration to the phase of a language only, without changing the totals."""
+        language_totals = self.languages.setdefault(language, {})
+        language_totals[phase] = language_totals.get(phase, 0) + duration_ns
+
+    def total(self):
+        """Return the sum of all phases in nanoseconds."""
+        return sum(self.totals.values())
+
+    def as_dict(self):
+        """Return the durations as {"total": {phase: ns}, "languages": {language: {phase: ns}}}."""
+        return {
+            "total": dict(self.totals),
+            "languages": {language: dict(language_totals) for language, language_totals in self.languages.items()},
+        }
@@ -0,0 +1,53 @@
+# AutoDriveTranslationTool/src/functions/profiled_run.py
+
+import os
+from contextlib import contextmanager, nullcontext
+
+
+class ProfiledRunMixin:
+    """Optional MemoryProfile and CpuProfile around the run of a Translator, Validator or TranslationFinder.
+
+    The class sets memory_profile, cpu_profile and input_path and provides _output(message, loc_params);
+    a class with another _output signature overrides _output_profile.
+    """
+
+    memory_profile = None
+    cpu_profile = None
+
+    @contextmanager
+    def _profiled_run(self):
+        """Profile the body and end the profiles even if it fails, so neither tracemalloc nor cProfile keeps running."""
+        if self.memory_profile:
+            self.memory_profile.begin()
+        if self.cpu_profile:
+            self.cpu_profile.begin()
+        try:
+            yield
+        finally:
+            try:
+                if self.cpu_profile:
+                    self._show_cpu_profile()
+            finally:
+                if self.memory_profile:
+                    # Translation key: "trn_memory_profile_written": "Memory profile written to: {0}"
+                    self._output_profile("trn_memory_profile_written", self.memory_profile.end())
+
+    def _show_cpu_profile(self):
+        """Stop the CpuProfile and output the functions with the highest cumulative time."""
+        stats_path = self.cpu_profile.end()
+        # Translation key: "trn_cpu_profile_summary": "\nProfile (Top {0} by cumulative time):"
+        self._output_profile("trn_cpu_profile_summary", self.cpu_profile.top_functions)
+        for function_stats in self.cpu_profile.summary():
+            # Translation key: "trn_cpu_profile_function": "- {0}: {1:.3f} s cumulative, {2:.3f} s own, {3} calls"
+            self._output_profile("trn_cpu_profile_function", *function_stats)
+        # Translation key: "trn_cpu_profile_written": "Profile written to: {0}"
+        self._output_profile("trn_cpu_profile_written", stats_path)
+
+    def _output_profile(self, message, *loc_params):
+        self._output(message, loc_params)
+
+    def _memory_phase(self, phase):
+        return self.memory_profile.phase(phase) if self.memory_profile else nullcontext()
+
+    def _memory_file_phase(self, file_path, phase):
+        return self.memory_profile.file_phase(os.path.relpath(file_path, self.input_path), phase) if self.memory_profile else nullcontext()
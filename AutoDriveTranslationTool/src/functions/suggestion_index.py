@@ -0,0 +1,106 @@
+# AutoDriveTranslationTool/src/functions/suggestion_index.py
+
+import re
+import math
+import heapq
+from collections import Counter, defaultdict
+
+
+class SuggestionIndex:
+    """Trigram index over the source terms of a dictionary, used to suggest existing entries for missing terms.
+
+    Similarity is the Dice coefficient of the trigram sets. A lookup takes the best entries found through the rarest
+    trigrams of the term as a threshold, reads only the posting lists of the rarest trigrams every entry reaching that
+    threshold must share, then checks those candidates exactly.
+    """
+
+    # Buy/sell point prefixes that mark variants of the same term.
+    PREFIX_PATTERN = re.compile(r'^(?:EK|VK)-', flags=re.IGNORECASE)
+    # Entries less similar than this share too little with the term to be a useful suggestion.
+    MIN_SIMILARITY = 0.4
+    # Posting lists read beyond the ones every similar enough entry must appear in.
+    EXTRA_PROBES = 2
+
+    def __init__(self, entries):
+        """Index the (source_text, target_text) entries of a dictionary."""
+        self.entries = list(entries.items())
+        self.entry_trigrams = []
+        self.entry_trigram_counts = []
+        self.postings = defaultdict(list)
+        for entry_id, (source_text, _) in enumerate(self.entries):
+            trigrams = self._trigrams(source_text)
+            self.entry_trigrams.append(trigrams)
+            self.entry_trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self.postings[trigram].append(entry_id)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def normalize(cls, text):
+        """Return the comparison form of a term: lower case, single spaces and without an EK-/VK- prefix."""
+        return cls.PREFIX_PATTERN.sub('', ' '.join(text.lower().split()))
+
+    @classmethod
+    def _trigrams(cls, text):
+        padded = f"  {cls.normalize(text)} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _similarity(self, trigrams, entry_id):
+        entry_trigrams = self.entry_trigrams[entry_id]
+        return 2 * len(trigrams & entry_trigrams) / (len(trigrams) + len(entry_trigrams))
+
+    def suggest(self, term, limit=3):
+        """Return up to limit (source_text, target_text, similarity) entries closest to term, best first."""
+        trigrams = self._trigrams(term)
+        trigram_count = len(trigrams)
+        ordered_trigrams = sorted(trigrams, key=lambda trigram: len(self.postings.get(trigram, ())))
+        postings = self.postings
+
+        # The rarest third of the trigrams finds the likely best entries cheaply; the similarity of the limit-th best
+        # of them is the threshold every other suggestion has to reach. The bounds below use it lowered a little so
+        # rounding cannot drop an entry tied with it.
+        probed = (trigram_count + 2) // 3
+        candidates = Counter()
+        for trigram in ordered_trigrams[:probed]:
+            candidates.update(postings.get(trigram, ()))
+        best = sorted((self._similarity(trigrams, entry_id) for entry_id, _ in candidates.most_common(limit * 4) if self.entries[entry_id][0] != term), reverse=True)
+        threshold = max(self.MIN_SIMILARITY, best[limit - 1] if len(best) >= limit else 0)
+        cutoff = threshold - 1e-9
+
+        # 2 * shared / (trigram_count + entry_trigram_count) >= cutoff with shared <= entry_trigram_count bounds both
+        # the shared trigrams and the trigram count of an entry. An entry sharing min_shared trigrams shares one of the
+        # trigram_count - min_shared + 1 rarest ones; reading EXTRA_PROBES more posting lists lets most candidates be
+        # dropped by their count alone before the rest of the term is checked per candidate.
+        ratio = cutoff / (2 - cutoff)
+        min_shared = max(1, math.ceil(trigram_count * ratio))
+        max_entry_trigram_count = math.floor(trigram_count / ratio)
+        probe_count = min(trigram_count, trigram_count - min_shared + 1 + self.EXTRA_PROBES)
+        for trigram in ordered_trigrams[probed:probe_count]:
+            candidates.update(postings.get(trigram, ()))
+        remaining_trigrams = ordered_trigrams[max(probed, probe_count):]
+        remaining_count = len(remaining_trigrams)
+        needed = min_shared - remaining_count
+        entry_trigram_counts = self.entry_trigram_counts
+        bound = cutoff * trigram_count
+
+        normalized_term = self.normalize(term)
+        scored = []
+        for entry_id, shared in candidates.items():
+            if shared < needed or 2 * (shared + remaining_count) < bound + cutoff * entry_trigram_counts[entry_id]:
+                continue
+            entry_trigram_count = entry_trigram_counts[entry_id]
+            if entry_trigram_count > max_entry_trigram_count:
+                continue
+            entry_trigrams = self.entry_trigrams[entry_id]
+            if remaining_count:
+                shared += len(entry_trigrams.intersection(remaining_trigrams))
+            similarity = 2 * shared / (trigram_count + entry_trigram_count)
+            if similarity < threshold:
+                continue
+            source_text, target_text = self.entries[entry_id]
+            if source_text == term:
+                continue
+            scored.append((similarity, -abs(len(self.normalize(source_text)) - len(normalized_term)), source_text, target_text))
+        return [(source_text, target_text, similarity) for similarity, _, source_text, target_text in heapq.nlargest(limit, scored)]
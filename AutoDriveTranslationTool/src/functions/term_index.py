@@ -0,0 +1,49 @@
+# AutoDriveTranslationTool/src/functions/term_index.py
+
+import re
+from collections import Counter, defaultdict
+from xml.sax.saxutils import unescape
+
+
+class TermIndex:
+    """Inverted index of the words used in map marker names and groups across a corpus of course files."""
+
+    MARKER_TEXT_PATTERN = re.compile(r'<(?:name|group)>(.*?)</(?:name|group)>')
+    LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.files = []
+        self.term_files = defaultdict(set)
+        self.term_occurrences = Counter()
+
+    def __len__(self):
+        return len(self.term_occurrences)
+
+    @classmethod
+    def read_marker_texts(cls, file_path):
+        """Return the name and group texts of a course file, with the predefined XML entities resolved."""
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return [unescape(text, {"&quot;": '"', "&apos;": "'"}) for text in cls.MARKER_TEXT_PATTERN.findall(file.read())]
+
+    def add(self, term, file_index):
+        """Count one occurrence of term in the file with the given index."""
+        self.term_occurrences[term] += 1
+        self.term_files[term].add(file_index)
+
+    def add_file(self, file_path):
+        """Tokenize the marker texts of a course file once and add its words to the index."""
+        file_index = len(self.files)
+        self.files.append(file_path)
+        for phrase in self.read_marker_texts(file_path):
+            for word in phrase.split():
+                if not word.isdigit() and self.LETTER_PATTERN.search(word):
+                    self.add(word, file_index)
+
+    def missing_terms(self, dictionary_terms=()):
+        """Return (term, occurrences, file_count) for every indexed term not in dictionary_terms, most frequent first."""
+        missing = self.term_occurrences.keys() - dictionary_terms
+        return sorted(
+            ((term, self.term_occurrences[term], len(self.term_files[term])) for term in missing),
+            key=lambda item: (-item[1], -item[2], item[0])
+        )
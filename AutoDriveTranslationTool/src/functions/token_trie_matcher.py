@@ -0,0 +1,96 @@
+# AutoDriveTranslationTool/src/functions/token_trie_matcher.py
+
+import re
+
+from AutoDriveTranslationTool.src.functions.dictionary_matcher import LETTER_PATTERN
+
+
+class TokenTrieMatcher:
+    """Whole-word dictionary matcher over a casefolded token trie.
+
+    Word boundaries for AutoDrive names: a token is a run of letters and digits (umlauts and ß included),
+    every other visible character such as '-', '/', '.' or '&' is a token of its own, and whitespace only
+    separates tokens. An entry matches where its tokens equal consecutive tokens of the text, so "Gülle"
+    matches the last token of "EK-Gülle" but never the inside of "Güllelager", and entries ending in
+    punctuation like "Schweineb." match as well. At every token the longest entry wins, like the regex engine.
+    """
+
+    TOKEN_PATTERN = re.compile(r'[^\W_]+|[^\w\s]|_')
+    # Key of the (source_text, target_text) entry that ends at a trie node.
+    TERMINAL = None
+
+    def __init__(self, entries, whole_word=True):
+        """Build the token trie from (source_text, target_text) pairs; whole_word is implied and kept for the shared interface."""
+        self.entries = dict(entries)
+        self.whole_word = True
+        self.trie = {}
+        for source_text, target_text in self.entries.items():
+            tokens = self.tokenize(source_text)
+            if not tokens:
+                continue
+            node = self.trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+            # The first entry wins for entries that only differ in case or spacing.
+            node.setdefault(self.TERMINAL, (source_text, target_text))
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def tokenize(cls, text):
+        """Return the casefolded tokens of text."""
+        return [token.casefold() for token in cls.TOKEN_PATTERN.findall(text)]
+
+    def _find_matches(self, text):
+        """Yield (start, end, source_text, target_text) for the leftmost-longest entry matches in text."""
+        spans = [(match.start(), match.end(), match.group(0).casefold()) for match in self.TOKEN_PATTERN.finditer(text)]
+        index = 0
+        while index < len(spans):
+            node = self.trie
+            longest = None
+            position = index
+            while position < len(spans):
+                node = node.get(spans[position][2])
+                if node is None:
+                    break
+                position += 1
+                if self.TERMINAL in node:
+                    longest = (position, node[self.TERMINAL])
+            if longest is None:
+                index += 1
+                continue
+            end_index, (source_text, target_text) = longest
+            yield spans[index][0], spans[end_index - 1][1], source_text, target_text
+            index = end_index
+
+    def sub(self, text):
+        """Translate text and return it together with the source texts that fired, in match order."""
+        fired_terms = []
+        if not self.trie or not text:
+            return text, fired_terms
+
+        parts = []
+        position = 0
+        for start, end, source_text, target_text in self._find_matches(text):
+            parts.append(text[position:start])
+            parts.append(target_text)
+            if target_text != text[start:end] and source_text not in fired_terms:
+                fired_terms.append(source_text)
+            position = end
+        if not parts:
+            return text, fired_terms
+        parts.append(text[position:])
+        return ''.join(parts), fired_terms
+
+    def untranslated_spans(self, text):
+        """Return the stripped parts of text that no dictionary entry matches, and the number of matched characters."""
+        spans = []
+        matched_characters = 0
+        position = 0
+        for start, end, _, _ in self._find_matches(text):
+            spans.append(text[position:start])
+            matched_characters += end - start
+            position = end
+        spans.append(text[position:])
+        return [span.strip(' -/,.;:()') for span in spans if LETTER_PATTERN.search(span)], matched_characters
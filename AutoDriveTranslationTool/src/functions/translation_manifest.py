@@ -0,0 +1,62 @@
+# AutoDriveTranslationTool/src/functions/translation_manifest.py
+
+import os
+import json
+
+from AutoDriveTranslationTool.src.functions.atomic_file import AtomicFile, hash_file
+
+
+class TranslationManifest:
+    """Record of which input and dictionary hashes produced each output file."""
+
+    FILE_NAME = ".translation_manifest.json"
+    VERSION = 2
+
+    def __init__(self, output_path):
+        """Load the manifest stored in the output directory, starting empty if it is missing or unreadable."""
+        self.output_path = os.path.normpath(output_path)
+        self.manifest_file_path = os.path.join(self.output_path, self.FILE_NAME)
+        self.entries = {}
+        try:
+            with open(self.manifest_file_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get("version") == self.VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    hash_file = staticmethod(hash_file)
+
+    def get_entry(self, output_file_path, input_hash, dictionary_hash):
+        """Return the entry of an output that is still up to date, or None if it has to be rebuilt."""
+        entry = self.entries.get(self._get_key(output_file_path))
+        if not entry or entry.get("input_hash") != input_hash or entry.get("dictionary_hash") != dictionary_hash:
+            return None
+        try:
+            stat = os.stat(output_file_path)
+        except OSError:
+            return None
+        # An output that was modified or replaced outside the tool is rebuilt.
+        if stat.st_size != entry.get("output_size") or stat.st_mtime_ns != entry.get("output_mtime_ns"):
+            return None
+        return entry
+
+    def set_entry(self, output_file_path, input_hash, dictionary_hash, fired_terms, violations=()):
+        """Record that an output was produced from the given hashes, with the terms that fired and its length violations."""
+        stat = os.stat(output_file_path)
+        self.entries[self._get_key(output_file_path)] = {
+            "input_hash": input_hash,
+            "dictionary_hash": dictionary_hash,
+            "output_size": stat.st_size,
+            "output_mtime_ns": stat.st_mtime_ns,
+            "fired_terms": list(fired_terms),
+            "violations": [list(violation) for violation in violations],
+        }
+
+    def save(self):
+        """Write the manifest atomically, leaving it untouched if nothing changed."""
+        with AtomicFile(self.manifest_file_path) as file:
+            file.write(json.dumps({"version": self.VERSION, "entries": self.entries}, ensure_ascii=False).encode('utf-8'))
+
+    def _get_key(self, output_file_path):
+        return os.path.relpath(output_file_path, start=self.output_path).replace(os.sep, '/')
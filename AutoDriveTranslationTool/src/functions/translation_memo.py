@@ -0,0 +1,31 @@
+# AutoDriveTranslationTool/src/functions/translation_memo.py
+
+from collections import OrderedDict
+
+
+class TranslationMemo:
+    """Bounded LRU memo of translated marker texts, keyed by (language, dictionary hash, source text)."""
+
+    DEFAULT_MAX_ENTRIES = 50000
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """Initialize an empty memo holding at most max_entries texts."""
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Return the stored (translated_text, fired_terms) for key, or None on a miss."""
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, translated_text, fired_terms):
+        """Store a translation, evicting the least recently used entry once the memo is full."""
+        self.entries[key] = (translated_text, tuple(fired_terms))
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
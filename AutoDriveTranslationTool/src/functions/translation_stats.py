@@ -0,0 +1,170 @@
+# AutoDriveTranslationTool/src/functions/translation_stats.py
+
+import os
+import csv
+import json
+import heapq
+from collections import Counter
+from operator import itemgetter
+
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes
+
+
+class TranslationStats:
+    """Counters of a translation run, mergeable and exportable as JSON or CSV.
+
+    File names are interned as integer IDs, so the per-file counts and violations are keyed by (file_id, language)
+    tuples instead of nested dicts of path strings. Every course gets its own statistics, built in the worker that
+    translated it, which combine into those of the run with merge().
+    """
+
+    __slots__ = (
+        "total_files_translated", "total_translations_made", "total_time_taken", "outputs_skipped", "outputs_unchanged", "markers_changed",
+        "memo_hits", "memo_misses", "length_violations", "file_names", "file_ids", "translations_per_file",
+        "translations_per_word", "translations_per_language", "violations_per_file", "phase_times", "phase_times_per_file",
+    )
+
+    def __init__(self):
+        """Initialize translation statistics."""
+        self.total_files_translated = 0
+        self.total_translations_made = 0
+        self.total_time_taken = 0
+        self.outputs_skipped = 0
+        self.outputs_unchanged = 0
+        self.markers_changed = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.length_violations = 0
+
+        self.file_names = []
+        self.file_ids = {}
+        self.translations_per_file = Counter()
+        self.translations_per_word = Counter()
+        self.translations_per_language = Counter()
+        self.violations_per_file = {}
+        self.phase_times = PhaseTimes()
+        self.phase_times_per_file = {}
+
+    @property
+    def avg_translations_per_file(self):
+        return self.total_translations_made / self.total_files_translated if self.total_files_translated > 0 else 0
+
+    @property
+    def unique_words_translated(self):
+        """Return the number of distinct source texts translated."""
+        return len(self.translations_per_word)
+
+    @staticmethod
+    def get_display_name(input_file_path, file_name=None):
+        """Return the file name of an input file with its map folder, as the statistics show it."""
+        return os.path.join(os.path.basename(os.path.dirname(input_file_path)), file_name or os.path.basename(input_file_path))
+
+    def get_file_id(self, file_name):
+        """Return the ID of a file name, interning it on first use."""
+        file_id = self.file_ids.get(file_name)
+        if file_id is None:
+            file_id = self.file_ids[file_name] = len(self.file_names)
+            self.file_names.append(file_name)
+        return file_id
+
+    def add_translations(self, file_name, language, fired_terms):
+        """Count the source texts translated in one file for one language."""
+        count = len(fired_terms)
+        self.translations_per_file[(self.get_file_id(file_name), language)] += count
+        self.translations_per_language[language] += count
+        self.translations_per_word.update(fired_terms)
+        self.total_translations_made += count
+
+    def add_violations(self, file_name, language, violations):
+        """Record the (line, text, max_length, tag) length violations of one file for one language, also when there are none."""
+        self.violations_per_file[(self.get_file_id(file_name), language)] = violations
+        self.length_violations += len(violations)
+
+    def add_phase_times(self, file_name, phase_times):
+        """Add the PhaseTimes of one file."""
+        self.phase_times.merge(phase_times)
+        self.phase_times_per_file[self.get_file_id(file_name)] = phase_times
+
+    def merge(self, other):
+        """Add the statistics of another part of the run; parts run in parallel, so the time taken is the longest one."""
+        for name in ("total_files_translated", "total_translations_made", "outputs_skipped", "outputs_unchanged", "markers_changed", "memo_hits", "memo_misses", "length_violations"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.total_time_taken = max(self.total_time_taken, other.total_time_taken)
+
+        file_ids = [self.get_file_id(file_name) for file_name in other.file_names]
+        for (file_id, language), count in other.translations_per_file.items():
+            self.translations_per_file[(file_ids[file_id], language)] += count
+        for (file_id, language), violations in other.violations_per_file.items():
+            self.violations_per_file[(file_ids[file_id], language)] = violations
+        for file_id, phase_times in other.phase_times_per_file.items():
+            self.phase_times_per_file[file_ids[file_id]] = phase_times
+        self.translations_per_word.update(other.translations_per_word)
+        self.translations_per_language.update(other.translations_per_language)
+        self.phase_times.merge(other.phase_times)
+
+    def get_file_translations(self):
+        """Return {file_name: {language: translations}} in the order the files were added."""
+        file_translations = {file_name: {} for file_name in self.file_names}
+        for (file_id, language), count in self.translations_per_file.items():
+            file_translations[self.file_names[file_id]][language] = count
+        return file_translations
+
+    def get_file_violations(self, language):
+        """Return (file_name, violations) of every file validated for language, in the order the files were added."""
+        return [(self.file_names[file_id], violations) for (file_id, file_language), violations in self.violations_per_file.items() if file_language == language]
+
+    def top_words(self, count=5):
+        """Return the count most translated (source_text, translations) pairs."""
+        return heapq.nlargest(count, self.translations_per_word.items(), key=itemgetter(1))
+
+    def top_files(self, count=5):
+        """Return the count (file_name, {language: translations}) pairs with the most translations."""
+        return heapq.nlargest(count, self.get_file_translations().items(), key=lambda item: sum(item[1].values()))
+
+    def slowest_files(self, count=5):
+        """Return the count (file_name, {phase: ns}) pairs that took the longest."""
+        slowest = heapq.nlargest(count, self.phase_times_per_file.items(), key=lambda item: item[1].total())
+        return [(self.file_names[file_id], phase_times.totals) for file_id, phase_times in slowest]
+
+    def as_dict(self):
+        """Return the statistics as a JSON serializable dict."""
+        file_translations = self.get_file_translations()
+        return {
+            "total_files_translated": self.total_files_translated,
+            "total_translations_made": self.total_translations_made,
+            "avg_translations_per_file": self.avg_translations_per_file,
+            "unique_words_translated": self.unique_words_translated,
+            "outputs_skipped": self.outputs_skipped,
+            "outputs_unchanged": self.outputs_unchanged,
+            "markers_changed": self.markers_changed,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "length_violations": self.length_violations,
+            "total_time_taken": self.total_time_taken,
+            "translations_per_language": dict(self.translations_per_language),
+            "translations_per_word": dict(self.translations_per_word.most_common()),
+            "phases_ns": self.phase_times.as_dict(),
+            "files": [
+                {"file": file_name, "translations": file_translations[file_name], "phases_ns": self.phase_times_per_file[file_id].as_dict() if file_id in self.phase_times_per_file else None}
+                for file_id, file_name in enumerate(self.file_names)
+            ],
+        }
+
+    def write_json(self, json_path):
+        """Write the statistics as JSON."""
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump(self.as_dict(), file, indent=2, ensure_ascii=False)
+            file.write('\n')
+
+    def write_csv(self, csv_path):
+        """Write one file,language,translations,milliseconds row per file and language; the time excludes parsing, which is shared by all languages."""
+        os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+        with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(("file", "language", "translations", "milliseconds"))
+            for file_name, translations_by_language in self.get_file_translations().items():
+                phase_times = self.phase_times_per_file.get(self.file_ids[file_name])
+                for language, translations in translations_by_language.items():
+                    milliseconds = sum(phase_times.languages.get(language, {}).values()) / 1e6 if phase_times else 0
+                    writer.writerow((file_name, language, translations, f"{milliseconds:.1f}"))
@@ -0,0 +1,146 @@
+# AutoDriveTranslationTool/src/functions/translation_worker.py
+
+import xml.etree.ElementTree as ET
+from xml.sax import SAXParseException
+from xml.sax.saxutils import escape
+
+from AutoDriveTranslationTool.src.functions.course_file import CourseFile
+from AutoDriveTranslationTool.src.functions.course_stream import StreamingCourseFile
+from AutoDriveTranslationTool.src.functions.course_patch import PatchedCourseFile
+from AutoDriveTranslationTool.src.functions.translation_memo import TranslationMemo
+from AutoDriveTranslationTool.src.functions.phase_times import PhaseTimes, PHASE_PARSE, PHASE_SUBSTITUTE
+from AutoDriveTranslationTool.src.functions.memory_profile import MemoryPhaseTimes
+from AutoDriveTranslationTool.src.functions.translation_stats import TranslationStats
+
+
+OUTPUT_MODE_TREE = "tree"
+OUTPUT_MODE_STREAM = "stream"
+OUTPUT_MODE_PATCH = "patch"
+
+# Course implementations per output mode; all of them take (input_file_path, dry_run) and expose
+# translate(output_file_paths, translate_text, phase_times), calling translate_text(language, marker, tag, text, line)
+# with the tag of the map marker (mm1, mm2, ...) and the line the text is written at.
+OUTPUT_MODES = {
+    OUTPUT_MODE_TREE: CourseFile,
+    OUTPUT_MODE_STREAM: StreamingCourseFile,
+    OUTPUT_MODE_PATCH: PatchedCourseFile,
+}
+
+
+# Compiled dictionaries of a pool worker and their hashes, set once per process by init_worker.
+_worker_dictionaries = None
+_worker_dictionary_hashes = None
+
+# Translation memo of this process; its keys carry the dictionary hash, so it stays valid across runs.
+_memo = None
+
+
+class CourseTranslationResult:
+    """Outcome of translating one course into every requested language."""
+
+    def __init__(self, input_file_path):
+        self.input_file_path = input_file_path
+        self.error = None
+        self.fired_terms = {}
+        self.violations = {}
+        # (marker, tag, text, translated_text, fired_terms) of every changed marker text per language, in dry runs.
+        self.diffs = {}
+        self.phase_times = PhaseTimes()
+        # Statistics of the outputs written for this course, merged into those of the run.
+        self.stats = TranslationStats()
+
+
+def init_worker(dictionaries, dictionary_hashes=None):
+    """Store the compiled dictionaries in a pool worker so tasks do not have to carry them."""
+    global _worker_dictionaries, _worker_dictionary_hashes
+    _worker_dictionaries = dictionaries
+    _worker_dictionary_hashes = dictionary_hashes
+
+
+def get_memo(max_entries):
+    """Return the memo of this process, recreating it when the requested size changes."""
+    global _memo
+    if _memo is None or _memo.max_entries != max_entries:
+        _memo = TranslationMemo(max_entries)
+    return _memo
+
+
+def clear_memo():
+    """Drop the memo of this process."""
+    global _memo
+    _memo = None
+
+
+def translate_course(input_file_path, output_file_paths, dictionaries=None, output_mode=OUTPUT_MODE_TREE, dictionary_hashes=None, memo_size=0, validation_rules=None, memory_profile=False, dry_run=False):
+    """Translate a course into every language of output_file_paths using the given output mode.
+
+    A dry_run finds and translates the marker texts like the output mode but writes nothing; it records the
+    changed marker texts in the diffs of the result instead.
+
+    With a memo_size and dictionary_hashes, repeated marker texts are served from the process-wide memo.
+    With validation_rules, every translated text is checked against its (tag, max_length) limit as it is written.
+    The time spent parsing, substituting and writing is recorded in the phase_times of the result, with
+    memory_profile also the traced memory of every phase. The stats of the result count the translations,
+    violations, memo lookups and unchanged outputs of the course.
+    """
+    if dictionaries is None:
+        dictionaries = _worker_dictionaries
+        dictionary_hashes = _worker_dictionary_hashes
+    memo = get_memo(memo_size) if memo_size and dictionary_hashes else None
+    result = CourseTranslationResult(input_file_path)
+    if memory_profile:
+        result.phase_times = MemoryPhaseTimes()
+    fired_terms_per_language = {language: [] for language in output_file_paths}
+    max_lengths = dict(validation_rules) if validation_rules else None
+    violations_per_language = {language: [] for language in output_file_paths}
+    diffs_per_language = {language: [] for language in output_file_paths} if dry_run else None
+    phase_times = result.phase_times
+    stats = result.stats
+
+    def translate_text(language, marker, tag, text, line):
+        start = phase_times.start()
+        if memo is None:
+            new_text, fired_terms = dictionaries[language].sub(text)
+        else:
+            key = (language, dictionary_hashes[language], text)
+            cached = memo.get(key)
+            if cached is None:
+                stats.memo_misses += 1
+                new_text, fired_terms = dictionaries[language].sub(text)
+                memo.put(key, new_text, fired_terms)
+            else:
+                stats.memo_hits += 1
+                new_text, fired_terms = cached
+        phase_times.stop(PHASE_SUBSTITUTE, start, language)
+        fired_terms_per_language[language].extend(fired_terms)
+        if diffs_per_language is not None and new_text != text:
+            diffs_per_language[language].append((marker, tag, text, new_text, fired_terms))
+        if max_lengths is not None:
+            # Limits apply to the text as it appears in the file, with its markup characters escaped.
+            max_length = max_lengths.get(tag)
+            written_text = escape(new_text)
+            if max_length is not None and len(written_text) > max_length:
+                violations_per_language[language].append((line, written_text, max_length, tag))
+        return new_text
+
+    try:
+        start = phase_times.start()
+        course = OUTPUT_MODES[output_mode](input_file_path, dry_run=dry_run)
+        phase_times.stop(PHASE_PARSE, start)
+        stats.outputs_unchanged = course.translate(output_file_paths, translate_text, phase_times)
+    except (ET.ParseError, SAXParseException) as e:
+        result.error = str(e)
+        return result
+
+    result.fired_terms = fired_terms_per_language
+    result.diffs = diffs_per_language or {}
+    result.violations = violations_per_language
+    file_name = TranslationStats.get_display_name(input_file_path)
+    for language in output_file_paths:
+        stats.add_translations(file_name, language, fired_terms_per_language[language])
+        if max_lengths is not None:
+            stats.add_violations(file_name, language, violations_per_language[language])
+        if diffs_per_language is not None:
+            stats.markers_changed += len(diffs_per_language[language])
+    stats.add_phase_times(file_name, phase_times)
+    return result
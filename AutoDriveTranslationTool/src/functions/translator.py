@@ -1,122 +1,286 @@
 # AutoDriveTranslationTool/src/functions/translator.py
 
 import os
-import re
+import csv
 import time
+from contextlib import contextmanager
 from datetime import timedelta
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 
 # Logger for debugging
 from AutoDriveTranslationTool.src.core.constants import LOGGER_NAME
+from AutoDriveTranslationTool.src.functions.atomic_file import link_or_copy
+from AutoDriveTranslationTool.src.functions.dictionary_cache import (
+    DictionaryCache, open_dictionary_cache, load_dictionary_matcher, get_matcher_engine, MATCHER_ENGINE_REGEX
+)
+from AutoDriveTranslationTool.src.functions.translation_manifest import TranslationManifest
+from AutoDriveTranslationTool.src.functions.translation_memo import TranslationMemo
+from AutoDriveTranslationTool.src.functions.validate_output_files import VALIDATION_RULES
+from AutoDriveTranslationTool.src.functions.phase_times import PHASES, PHASE_DICTIONARY_LOAD
+from AutoDriveTranslationTool.src.functions.profiled_run import ProfiledRunMixin
+from AutoDriveTranslationTool.src.functions.translation_stats import TranslationStats
+from AutoDriveTranslationTool.src.functions.translation_worker import (
+    init_worker, translate_course, CourseTranslationResult, OUTPUT_MODES, OUTPUT_MODE_TREE
+)
 
 from GuiFramework.utilities.logging import Logger
 
 
-class Translator:
-    class TranslationStats:
-        def __init__(self):
-            """Initialize translation statistics."""
-            self.total_files_translated = 0
-            self.total_translations_made = 0
-            self.avg_translations_per_file = 0
-            self.total_time_taken = 0
-
-            self.unique_words_translated = set()
-            self.translations_per_file = {}
-            self.translations_per_word = {}
-            self.translations_per_language = {}
-
-        def increment_translations(self, source_text):
-            """Increment the count of translations made."""
-            self.total_translations_made += 1
-            self.translations_per_word[source_text] = self.translations_per_word.get(source_text, 0) + 1
-            self.unique_words_translated.add(source_text)
-
-    def __init__(self, input_files, dictionaries, input_path, output_path, output_widget=None, console_output=False, progress_bar=None, whole_word=False, localization_manager=None):
-        """Initialize the translator and start the translation process."""
+class Translator(ProfiledRunMixin):
+    def __init__(self, input_files, dictionaries, input_path, output_path, output_widget=None, console_output=False, progress_bar=None, whole_word=False, localization_manager=None, cache_path=None, workers=1, output_mode=OUTPUT_MODE_TREE, incremental=True, cancel_event=None, memo_size=TranslationMemo.DEFAULT_MAX_ENTRIES, validation_rules=VALIDATION_RULES, matcher_engine=MATCHER_ENGINE_REGEX, memory_profile=None, cpu_profile=None, stats_path=None, dry_run_report=None):
+        """Initialize the translator and start the translation process; a MemoryProfile or CpuProfile profiles the run in a single process.
+
+        The full statistics are written as translation_stats.json and .csv to stats_path if given, the console only shows a summary.
+        With a dry_run_report, no course file is written; every changed marker text is written to that CSV file instead.
+        """
         start_time = time.time()
+        self.memory_profile = memory_profile
+        self.cpu_profile = cpu_profile
+        # Set before the run, the profiles are reported through _output even if the run fails.
         self.logger = Logger.get_logger(LOGGER_NAME)
-        self.input_files = input_files
-        self.dictionaries_path = dictionaries
-        self._validate_input_files()
-        self._validate_dictionaries()
-        self.input_path = input_path
-        self.output_path = output_path
         self.output_widget = output_widget
-        if self.output_widget:
-            self.output_widget.clear_console()
         self.console_output = console_output
-        self.progress_bar = progress_bar
-        if self.progress_bar:
-            self.progress_bar.set(0)
-        self.whole_word = whole_word
         self.loc = localization_manager.localize
         self.loc_param = localization_manager.localize_with_params
-        self.dictionaries = self._create_merged_dictionaries()
-        self.stats = self.TranslationStats()
-        self._translate_files()
-        end_time = time.time()
-        self.stats.total_time_taken = end_time - start_time
-        self._show_stats()
+        with self._profiled_run():
+            if self.output_widget:
+                self.output_widget.clear_console()
+            self.input_files = input_files
+            self.dictionaries_path = dictionaries
+            self.input_path = input_path
+            self.output_path = output_path
+            self.progress_bar = progress_bar
+            if self.progress_bar:
+                self.progress_bar.set(0)
+            self.whole_word = whole_word
+            self.matcher_engine = matcher_engine
+            self.dictionary_cache = open_dictionary_cache(cache_path, whole_word, matcher_engine)
+            self.workers = 1 if memory_profile or cpu_profile else workers
+            if output_mode not in OUTPUT_MODES:
+                raise ValueError(f"Unknown output mode '{output_mode}', expected one of: {', '.join(OUTPUT_MODES)}")
+            self.output_mode = output_mode
+            self.dry_run_report = dry_run_report
+            # A dry run translates every file, the manifest only describes outputs that were written.
+            self.manifest = TranslationManifest(output_path) if incremental and not dry_run_report else None
+            self.diff_writer = None
+            self.cancel_event = cancel_event
+            self.memo_size = memo_size
+            self.validation_rules = tuple(validation_rules) if validation_rules else None
+            self._validate_input_files()
+            self._validate_dictionaries()
+            self.stats = TranslationStats()
+            self.stats_path = stats_path
+            with self._memory_phase("dictionary_merge"):
+                self.dictionaries = self._create_merged_dictionaries()
+            with self._memory_phase("translate"), self._open_dry_run_report():
+                self._translate_files()
+            end_time = time.time()
+            self.stats.total_time_taken = end_time - start_time
+            self.error_count = self.stats.length_violations
+            with self._memory_phase("stats"):
+                self._show_stats()
+                if self.stats_path:
+                    self._write_stats()
+                if self.dry_run_report:
+                    # Translation key: "trn_dry_run_report_written": "\nDry run, no course file was written. {0} changed marker texts written to: {1}"
+                    self._output("trn_dry_run_report_written", self.stats.markers_changed, self.dry_run_report)
+                if self.validation_rules:
+                    self._show_validation_report()
+
+    def _output_profile(self, message, *loc_params):
+        self._output(message, *loc_params)
+
+    @contextmanager
+    def _open_dry_run_report(self):
+        """Open the dry run report for _merge_result to stream the changed marker texts into."""
+        if not self.dry_run_report:
+            yield
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.dry_run_report)), exist_ok=True)
+        with open(self.dry_run_report, 'w', encoding='utf-8', newline='') as report_file:
+            self.diff_writer = csv.writer(report_file)
+            self.diff_writer.writerow(("file", "language", "marker", "tag", "before", "after", "terms"))
+            try:
+                yield
+            finally:
+                self.diff_writer = None
 
     def _translate_files(self):
-        """Translate all input files using the loaded dictionaries."""
-        self.stats.total_files_translated = len(self.input_files)
+        """Translate all input files using the loaded dictionaries, parsing each file only once.
 
-        total_major_steps = self.stats.total_files_translated * len(self.dictionaries.keys())
+        The statistics of every course, from its worker or from the outputs it shares with another course, are merged
+        into those of the run in input order.
+        """
+        total_major_steps = len(self.input_files) * len(self.dictionaries.keys())
         major_step_increment = 1 / total_major_steps if total_major_steps != 0 else 0
 
         current_progress = 0
         if self.progress_bar:
             self.progress_bar.set(0)
 
-        for language, dictionary in self.dictionaries.items():
+        for language in self.dictionaries.keys():
             self.stats.translations_per_language[language] = 0
 
-            for file_index, (file_name, input_file_path) in enumerate(self.input_files):
-                translations_this_file = self._translate_file(file_name, input_file_path, language, dictionary)
-                current_progress += major_step_increment
-                if self.progress_bar:
-                    self.progress_bar.set(min(current_progress, 1))
-                    self.progress_bar.update()
-                _file_name = os.path.join(os.path.basename(os.path.dirname(input_file_path)), file_name)
-                self.stats.translations_per_file.setdefault(_file_name, {})[language] = translations_this_file
-                self.stats.translations_per_language[language] += translations_this_file
-
-        self.stats.avg_translations_per_file = self.stats.total_translations_made / self.stats.total_files_translated if self.stats.total_files_translated > 0 else 0
+        # Byte-identical input files share one representative that is translated once per run.
+        courses = []
+        representatives = {}
+        jobs = []
+        for file_name, input_file_path in self.input_files:
+            input_hash = TranslationManifest.hash_file(input_file_path) if self.manifest else input_file_path
+            output_file_paths = self._get_output_file_paths(input_file_path)
+            courses.append((file_name, input_file_path, input_hash, output_file_paths))
+            if input_hash in representatives:
+                continue
+            representatives[input_hash] = input_file_path
+            pending_output_file_paths = {
+                language: output_file_path for language, output_file_path in output_file_paths.items()
+                if self._get_manifest_entry(output_file_path, input_hash, language) is None
+            }
+            if pending_output_file_paths:
+                jobs.append((input_file_path, pending_output_file_paths))
+
+        results = {}
+        for (input_file_path, output_file_paths), result in zip(jobs, self._run_jobs(jobs)):
+            results[input_file_path] = result
+            if self.memory_profile and result.error is None:
+                self.memory_profile.add_file(TranslationStats.get_display_name(input_file_path), result.phase_times)
+            current_progress += major_step_increment * len(output_file_paths)
+            self._update_progress(current_progress)
+
+        pending_representatives = {input_file_path for input_file_path, _ in jobs}
+        for file_name, input_file_path, input_hash, output_file_paths in courses:
+            if representatives[input_hash] in pending_representatives and representatives[input_hash] not in results:
+                # The run was cancelled before this file was translated.
+                continue
+            representative_result = results.get(representatives[input_hash])
+            if representative_result is not None and representative_result.error is None and input_file_path == representatives[input_hash]:
+                # A failed course counts as an error only, the stats its worker collected before failing are dropped.
+                self.stats.merge(representative_result.stats)
+            result = self._complete_result(file_name, input_file_path, input_hash, output_file_paths, representatives[input_hash], representative_result)
+            self._merge_result(file_name, result)
+            if input_file_path != representatives[input_hash] or representative_result is None:
+                current_progress += major_step_increment * len(output_file_paths)
+            elif representative_result.error is None:
+                current_progress += major_step_increment * (len(output_file_paths) - len(representative_result.fired_terms))
+            self._update_progress(current_progress)
+
+        if self.manifest:
+            self.manifest.save()
+
+        if self._is_cancelled():
+            # Translation key: "trn_translation_cancelled": "Translation cancelled, the remaining files were skipped."
+            self._output("trn_translation_cancelled")
+
         if self.progress_bar:
             self.progress_bar.set(1)
 
-    def _translate_file(self, file_name, input_file_path, language, dictionary):
-        """Translate a single file and return the number of translations made."""
-        translations_this_file = 0
-
+    def _update_progress(self, current_progress):
+        if self.progress_bar:
+            self.progress_bar.set(min(current_progress, 1))
+            self.progress_bar.update()
+
+    def _run_jobs(self, jobs):
+        """Yield the result of every (input_file_path, output_file_paths) job in job order."""
+        workers = self.workers if self.workers > 0 else os.cpu_count() or 1
+        if workers == 1 or len(jobs) < 2:
+            for input_file_path, output_file_paths in jobs:
+                if self._is_cancelled():
+                    return
+                yield translate_course(input_file_path, output_file_paths, self.dictionaries, self.output_mode, self.dictionary_hashes, self.memo_size, self.validation_rules, self.memory_profile is not None, self.dry_run_report is not None)
+            return
+
+        # Each worker receives the compiled dictionaries once through its initializer.
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), initializer=init_worker, initargs=(self.dictionaries, self.dictionary_hashes)) as executor:
+            futures = [executor.submit(translate_course, input_file_path, output_file_paths, None, self.output_mode, None, self.memo_size, self.validation_rules, False, self.dry_run_report is not None) for input_file_path, output_file_paths in jobs]
+            for future in futures:
+                if self._is_cancelled():
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    return
+                yield future.result()
+
+    def _is_cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _get_output_file_paths(self, input_file_path):
+        """Return the output file path of an input file for every language."""
         relative_path = os.path.relpath(input_file_path, start=self.input_path)
-        output_dir_path = os.path.join(self.output_path, language, os.path.dirname(relative_path))
-        os.makedirs(output_dir_path, exist_ok=True)
-        output_file_path = os.path.join(output_dir_path, os.path.basename(input_file_path))
-
-        tree = ET.parse(input_file_path)
-        root = tree.getroot()
-
-        for mapmarker in root.iter('mapmarker'):
-            for mm in mapmarker:
-                for tag in ['name', 'group']:
-                    element = mm.find(tag)
-                    if element is not None and element.text:
-                        for source_text, (regex, target_text) in dictionary.items():
-                            new_text = regex.sub(target_text, element.text)
-                            if new_text != element.text:
-                                element.text = new_text
-                                self.stats.increment_translations(source_text)
-                                translations_this_file += 1
-
-        _file_name = os.path.join(os.path.basename(os.path.dirname(input_file_path)), file_name)
-        self.stats.translations_per_file.setdefault(_file_name, {})[language] = translations_this_file
-
-        tree.write(output_file_path, encoding='utf-8')
-
-        return translations_this_file
+        return {language: os.path.join(self.output_path, language, relative_path) for language in self.dictionaries.keys()}
+
+    def _get_manifest_entry(self, output_file_path, input_hash, language):
+        """Return the manifest entry of an output that is still up to date, or None."""
+        if not self.manifest:
+            return None
+        return self.manifest.get_entry(output_file_path, input_hash, self._get_manifest_dictionary_hash(language))
+
+    def _get_manifest_dictionary_hash(self, language):
+        # The limits are part of the hash so recorded violations are refreshed when they change.
+        validation_rules = ','.join(f"{tag}={max_length}" for tag, max_length in self.validation_rules or ())
+        return f"{self.dictionary_hashes[language]}:{self.output_mode}:{validation_rules}"
+
+    def _complete_result(self, file_name, input_file_path, input_hash, output_file_paths, representative_path, representative_result):
+        """Build the result of one input file from the translated, skipped or copied output of its representative.
+
+        The stats of the result count the file and the outputs its representative's worker did not write.
+        """
+        result = CourseTranslationResult(input_file_path)
+        if representative_result is not None and representative_result.error is not None:
+            result.error = representative_result.error
+            return result
+
+        stats = result.stats
+        stats.total_files_translated = 1
+        display_name = TranslationStats.get_display_name(input_file_path, file_name)
+        representative_output_file_paths = self._get_output_file_paths(representative_path)
+        for language, output_file_path in output_file_paths.items():
+            translated = representative_result is not None and language in representative_result.fired_terms
+            diffs = ()
+            if translated:
+                fired_terms = representative_result.fired_terms[language]
+                violations = representative_result.violations.get(language, [])
+                diffs = result.diffs[language] = representative_result.diffs.get(language, ())
+            else:
+                manifest_entry = self._get_manifest_entry(representative_output_file_paths[language], input_hash, language)
+                fired_terms = manifest_entry["fired_terms"]
+                violations = [tuple(violation) for violation in manifest_entry["violations"]]
+
+            result.fired_terms[language] = fired_terms
+            result.violations[language] = violations
+            # Outputs written by the worker are counted in its statistics already.
+            if output_file_path != representative_output_file_paths[language] or not translated:
+                stats.add_translations(display_name, language, fired_terms)
+                if self.validation_rules:
+                    stats.add_violations(display_name, language, violations)
+                stats.markers_changed += len(diffs)
+
+            if output_file_path == representative_output_file_paths[language]:
+                if not translated:
+                    stats.outputs_skipped += 1
+            elif self._get_manifest_entry(output_file_path, input_hash, language) is not None:
+                stats.outputs_skipped += 1
+                continue
+            elif not link_or_copy(representative_output_file_paths[language], output_file_path):
+                stats.outputs_unchanged += 1
+
+            if self.manifest:
+                self.manifest.set_entry(output_file_path, input_hash, self._get_manifest_dictionary_hash(language), fired_terms, violations)
+        return result
+
+    def _merge_result(self, file_name, result):
+        """Add the result of one course to the statistics and its changed marker texts to the dry run report."""
+        if result.error is not None:
+            self.logger.log_error(f"Error parsing XML file '{result.input_file_path}': {result.error}", module_name='Translator')
+            # Translation key: "trn_error_parsing_xml_file": "Error parsing XML file '{0}': {1}"
+            self._output("trn_error_parsing_xml_file", result.input_file_path, result.error)
+            return
+
+        self.stats.merge(result.stats)
+        if self.diff_writer:
+            display_name = TranslationStats.get_display_name(result.input_file_path, file_name)
+            for language in self.dictionaries.keys():
+                self.diff_writer.writerows(
+                    (display_name, language, marker, tag, text, translated_text, ';'.join(fired_terms))
+                    for marker, tag, text, translated_text, fired_terms in result.diffs.get(language, ())
+                )
 
     def _show_stats(self):
         """Display translation statistics."""
@@ -129,26 +293,31 @@ class Translator:
         # Translation key: "trn_avg_translations_per_file": "- Average translations per file: {0:.2f}"
         self._output("trn_avg_translations_per_file", self.stats.avg_translations_per_file)
         # Translation key: "trn_unique_words_translated": "- Unique words translated: {0}"
-        self._output("trn_unique_words_translated", len(self.stats.unique_words_translated))
+        self._output("trn_unique_words_translated", self.stats.unique_words_translated)
+        # Translation key: "trn_outputs_skipped": "- Unchanged outputs skipped: {0}"
+        self._output("trn_outputs_skipped", self.stats.outputs_skipped)
+        # Translation key: "trn_outputs_unchanged": "- Outputs left untouched (same content): {0}"
+        self._output("trn_outputs_unchanged", self.stats.outputs_unchanged)
+        # Translation key: "trn_memo_hits": "- Translation memo: {0} hits, {1} misses"
+        self._output("trn_memo_hits", self.stats.memo_hits, self.stats.memo_misses)
+        if self.validation_rules:
+            # Translation key: "trn_length_violations": "- Texts over the length limit: {0}"
+            self._output("trn_length_violations", self.stats.length_violations)
         # Translation key: "trn_total_time_taken": "- Total time taken: {0}"
         self._output("trn_total_time_taken", timedelta(seconds=self.stats.total_time_taken))
 
-        # Translation key: "trn_file_based_statistics": "\nFile-based Statistics:"
+        # Translation key: "trn_file_based_statistics": "\nFile-based Statistics (Top 5):"
         self._output("trn_file_based_statistics")
-        current_file = None
-        for file, translations_by_language in self.stats.translations_per_file.items():
-            if file != current_file:
-                # Translation key: "trn_file_translations": "{0}:"
-                self._output("trn_file_translations", file, prefix='  -')
-                current_file = file
+        for file, translations_by_language in self.stats.top_files(5):
+            # Translation key: "trn_file_translations": "{0}:"
+            self._output("trn_file_translations", file, prefix='  -')
             for language, translations in translations_by_language.items():
                 # Translation key: "trn_file_language_translations": "- {0} translations in {1}"
                 self._output("trn_file_language_translations", translations, language, prefix='    -')
 
         # Translation key: "trn_translation_based_statistics": "\nTranslation-based Statistics (Top 5):"
         self._output("trn_translation_based_statistics")
-        sorted_translations = sorted(self.stats.translations_per_word.items(), key=lambda item: item[1], reverse=True)[:5]
-        for word, count in sorted_translations:
+        for word, count in self.stats.top_words(5):
             # Translation key: "trn_word_translation_count": "- {0}: {1} times"
             self._output("trn_word_translation_count", word, count)
 
@@ -158,6 +327,65 @@ class Translator:
             # Translation key: "trn_language_translation_count": "- {0}: {1} translations"
             self._output("trn_language_translation_count", language, count)
 
+        self._show_phase_times()
+
+    @staticmethod
+    def _format_phase_times(phase_times):
+        return ', '.join(f"{phase} {phase_times[phase] / 1e6:.1f} ms" for phase in PHASES if phase in phase_times)
+
+    def _show_phase_times(self):
+        """Display where the time went, per phase, per language and for the slowest files."""
+        # Translation key: "trn_phase_based_statistics": "\nPhase-based Statistics:"
+        self._output("trn_phase_based_statistics")
+        for phase in PHASES:
+            if phase in self.stats.phase_times.totals:
+                # Translation key: "trn_phase_time": "- {0}: {1:.1f} ms"
+                self._output("trn_phase_time", phase, self.stats.phase_times.totals[phase] / 1e6)
+        for language, phase_times in self.stats.phase_times.languages.items():
+            # Translation key: "trn_language_phase_times": "- {0}: {1}"
+            self._output("trn_language_phase_times", language, self._format_phase_times(phase_times))
+
+        # Translation key: "trn_slowest_files": "\nSlowest Files (Top 5):"
+        self._output("trn_slowest_files")
+        for file, phase_times in self.stats.slowest_files(5):
+            # Translation key: "trn_file_phase_times": "- {0}: {1:.1f} ms ({2})"
+            self._output("trn_file_phase_times", file, sum(phase_times.values()) / 1e6, self._format_phase_times(phase_times))
+
+    def _write_stats(self):
+        """Write the full statistics as JSON and CSV."""
+        json_path = os.path.join(self.stats_path, "translation_stats.json")
+        csv_path = os.path.join(self.stats_path, "translation_stats.csv")
+        self.stats.write_json(json_path)
+        self.stats.write_csv(csv_path)
+        # Translation key: "trn_stats_written": "\nStatistics of every file written to: {0}, {1}"
+        self._output("trn_stats_written", json_path, csv_path)
+
+    def _show_validation_report(self):
+        """Display the length violations found while writing, in the per-file, per-line layout of the Validator."""
+        for language in self.dictionaries.keys():
+            # Translation key: "vof_validating_language": "\nValidation results for {0}:"
+            self._output("vof_validating_language", language)
+            files_per_folder = {}
+            for display_name, violations in self.stats.get_file_violations(language):
+                folder, file_name = os.path.split(display_name)
+                files_per_folder.setdefault(os.path.join(language, folder), []).append((file_name, violations))
+            for folder, files in files_per_folder.items():
+                self._output("trn_file_translations", f"{folder}\\", prefix='-')
+                for file_name, violations in files:
+                    if not violations:
+                        # Translation key: "trn_file_validation_ok": "{0}: OK"
+                        self._output("trn_file_validation_ok", file_name, prefix='  -')
+                        continue
+                    self._output("trn_file_translations", file_name, prefix='  -')
+                    # Translation key: "vof_file_errors": "    - Total errors: {0}"
+                    self._output("vof_file_errors", len(violations))
+                    for line_no, text, max_length, tag in violations:
+                        # Translation key: "vof_line_exceeds_max_length": "Line {0}: \"{1}\" exceeds max length of ({2}/{3} characters). <{4}>"
+                        self._output("vof_line_exceeds_max_length", line_no, text, len(text), max_length, tag, prefix='        -')
+        if self.stats.length_violations:
+            # Translation key: "vof_validation_finished_info": "\nReview the errors above and adjust your XML content to meet the length requirements for <name> and <group> tags.\n"
+            self._output("vof_validation_finished_info")
+
     def _output(self, message, *args, **kwargs):
         """Output a message to the console or the output widget."""
         auto_new_line = kwargs.get('auto_new_line', True)
@@ -175,24 +403,17 @@ class Translator:
             print(final_message, end='')
 
     def _validate_input_files(self):
-        """Validate the input files to ensure they are XML files."""
-        for file_name, input_file_path in self.input_files:
+        """Validate the input files to ensure they are XML files; well-formedness is checked when they are parsed."""
+        for file_name, input_file_path in list(self.input_files):
             if not input_file_path.endswith('.xml'):
                 self.input_files.remove((file_name, input_file_path))
                 self.logger.log_error(f"Input file '{input_file_path}' is not an XML file.", module_name='Translator')
                 # Translation key: "trn_error_invalid_input_file": "Input file '{0}' is not an XML file."
                 self._output("trn_error_invalid_input_file", input_file_path)
-            try:
-                ET.parse(input_file_path)
-            except ET.ParseError as e:
-                self.input_files.remove((file_name, input_file_path))
-                self.logger.log_error(f"Error parsing XML file '{input_file_path}': {e}", module_name='Translator')
-                # Translation key: "trn_error_parsing_xml_file": "Error parsing XML file '{0}': {1}"
-                self._output("trn_error_parsing_xml_file", input_file_path, e)
 
     def _validate_dictionaries(self):
         """Validate the dictionaries to ensure they are .dic files."""
-        for dictionary_name, dictionary_path in self.dictionaries_path:
+        for dictionary_name, dictionary_path in list(self.dictionaries_path):
             if not dictionary_path.endswith('.dic'):
                 self.dictionaries_path.remove((dictionary_name, dictionary_path))
                 self.logger.log_error(f"Dictionary '{dictionary_path}' is not a .dic file.", module_name='Translator')
@@ -200,25 +421,19 @@ class Translator:
                 self._output("trn_error_invalid_dictionary", dictionary_path)
 
     def _create_merged_dictionaries(self):
-        """Merge dictionaries from provided paths into a single dictionary."""
-        merged_dictionaries = {}
-        in_comment_block = False
+        """Merge dictionaries from provided paths into a single matcher per language."""
+        dictionary_paths_per_language = {}
         for dictionary_name, dictionary_path in self.dictionaries_path:
             language = os.path.basename(os.path.dirname(dictionary_path))
-            merged_dictionaries.setdefault(language, {})
-            with open(dictionary_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if line.startswith('###*'):
-                        in_comment_block = True
-                    elif line.endswith('*###'):
-                        in_comment_block = False
-                    if in_comment_block or not line:
-                        continue
-                    parts = line.split(",", maxsplit=1)
-                    if len(parts) == 2:
-                        source_text, target_text = parts
-                        regex_pattern = r'\b' + re.escape(source_text) + r'\b' if self.whole_word else re.escape(source_text)
-                        regex_object = re.compile(regex_pattern, flags=re.IGNORECASE)
-                        merged_dictionaries[language][source_text] = (regex_object, target_text)
+            dictionary_paths_per_language.setdefault(language, []).append(dictionary_path)
+
+        merged_dictionaries = {}
+        self.dictionary_hashes = {}
+        for language, dictionary_paths in dictionary_paths_per_language.items():
+            start = self.stats.phase_times.start()
+            cache_key, matcher = load_dictionary_matcher(dictionary_paths, self.whole_word, self.dictionary_cache, self.logger, self.matcher_engine)
+            self.stats.phase_times.stop(PHASE_DICTIONARY_LOAD, start, language)
+            # The memo and the manifest need the dictionary hash with or without a cache.
+            self.dictionary_hashes[language] = cache_key or DictionaryCache.compute_key(dictionary_paths, self.whole_word, get_matcher_engine(self.whole_word, self.matcher_engine))
+            merged_dictionaries[language] = matcher
         return merged_dictionaries
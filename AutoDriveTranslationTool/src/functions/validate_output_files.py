@@ -2,58 +2,120 @@
 
 import os
 import re
+from functools import lru_cache
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
 from src.utilities.func_helpers import output
+from AutoDriveTranslationTool.src.functions.profiled_run import ProfiledRunMixin
+
+
+# AutoDrive's default character limits per marker tag; the configured limits are passed in as (tag, max_length) pairs.
+VALIDATION_RULES = (
+    ('name', 30),
+    ('group', 20)
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_rules(validation_rules):
+    """Return (tag_name, prefilter, pattern, max_length) for every rule."""
+    return [
+        (tag_name, f'<{tag_name}>', re.compile(f'<{tag_name}>(.*?)</{tag_name}>'), max_length)
+        for tag_name, max_length in validation_rules
+    ]
+
+
+def scan_output_file(file_path, validation_rules=VALIDATION_RULES):
+    """Stream a file once and return (is_empty, [(line_no, text, max_length, tag_name)]) for every text over its limit.
+
+    Lines without an opening tag are skipped with a substring test before any regex work.
+    """
+    compiled_rules = _compile_rules(validation_rules)
+    violations = []
+    is_empty = True
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_no, line in enumerate(file, start=1):
+            if is_empty and not line.isspace():
+                is_empty = False
+            if '<' not in line:
+                continue
+            for tag_name, prefilter, pattern, max_length in compiled_rules:
+                if prefilter not in line:
+                    continue
+                for text_inside_tag in pattern.findall(line):
+                    if len(text_inside_tag) > max_length:
+                        violations.append((line_no, text_inside_tag, max_length, tag_name))
+    return is_empty, violations
 
 
-class Validator:
-    def __init__(self, input_path, languages, output_widget=None, localization_manager=None, logger=None, console=False):
+class Validator(ProfiledRunMixin):
+    def __init__(self, input_path, languages, output_widget=None, localization_manager=None, logger=None, console=False, workers=1, validation_rules=VALIDATION_RULES, memory_profile=None, cpu_profile=None):
         self.input_path = os.path.normpath(input_path)
         self.languages = languages.split(',') if isinstance(languages, str) else languages
         self.output_widget = output_widget
         self.logger = logger
         self.console = console
+        self.error_count = 0
+        # Worker processes are neither traced nor profiled, a profiled run stays in this process.
+        self.workers = 1 if memory_profile or cpu_profile else workers
+        self.validation_rules = tuple(validation_rules)
+        self.memory_profile = memory_profile
+        self.cpu_profile = cpu_profile
 
         self.loc = localization_manager.localize
         self.loc_param = localization_manager.localize_with_params
 
-        self._validate_output_files()
+        with self._profiled_run(), self._memory_phase("validate"):
+            self._validate_output_files()
 
     def _output(self, message, loc_params=None, message_type=""):
         output(message, message_type, self.loc, self.output_widget, self.console, self.loc_param, loc_params, self.logger)
 
-    def _validate_output_file(self, file_path, errors):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            file_text = file.read()
+    def _validate_output_file(self, file_path, errors, scan_result=None):
+        is_empty, violations = scan_result if scan_result is not None else scan_output_file(file_path, self.validation_rules)
 
-        if not file_text.strip():
-            errors.append((self.loc("vof_file_empty", 0)))
+        if is_empty:
+            errors.append((self.loc("vof_file_empty"), 0))
             return False
 
-        validation_rules = [
-            (r'<name>(.*?)<\/name>', 30, 'name'),
-            (r'<group>(.*?)<\/group>', 20, 'group')
-        ]
+        for line_no, text_inside_tag, max_length, tag_name in violations:
+            error_message = self.loc_param("vof_line_exceeds_max_length", line_no, text_inside_tag, len(text_inside_tag), max_length, tag_name)
+            errors.append((error_message, line_no))
 
-        for line_no, line in enumerate(file_text.splitlines(), start=1):
-            for pattern, max_length, tag_name in validation_rules:
-                matches = re.findall(pattern, line)
-                for text_inside_tag in matches:
-                    if len(text_inside_tag) > max_length:
-                        error_message = self.loc_param("vof_line_exceeds_max_length", line_no, text_inside_tag, max_length, tag_name)
-                        errors.append((error_message, line_no))
+    def _scan_output_files(self, file_paths):
+        """Yield the scan result of every file in order, using a process pool when several workers are requested."""
+        workers = self.workers if self.workers > 0 else os.cpu_count() or 1
+        if workers == 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield scan_output_file(file_path, self.validation_rules)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(file_paths))) as executor:
+            yield from executor.map(scan_output_file, file_paths, repeat(self.validation_rules), chunksize=4)
 
     def _validate_output_files(self):
         self._output("vof_starting_validation", (len(self.languages), ', '.join(self.languages)))
         self._output("vof_input", (self.input_path))
 
+        # Collect every file first so all languages and directories can be scanned in one pool.
+        language_roots = []
+        file_paths = []
         for language in self.languages:
-            self._output("vof_validating_language", (language))
             language_path = os.path.join(self.input_path, language)
-            if not os.path.exists(language_path):
+            roots = [(root, files) for root, _, files in os.walk(language_path)] if os.path.exists(language_path) else None
+            language_roots.append((language, roots))
+            for root, files in roots or ():
+                file_paths.extend(os.path.join(root, file) for file in files)
+        scan_results = self._scan_output_files(file_paths)
+
+        for language, roots in language_roots:
+            self._output("vof_validating_language", (language))
+            if roots is None:
                 self._output("vof_language_not_found", (os.path.normpath(language)), "error")
                 continue
 
-            for root, _, files in os.walk(language_path):
+            for root, files in roots:
                 relative_root = os.path.relpath(root, self.input_path)
                 normalized_relative_root = os.path.normpath(relative_root)
                 has_files_with_errors = False
@@ -61,9 +123,12 @@ class Validator:
                 for file in files:
                     file_path = os.path.join(root, file)
                     file_errors = []
-                    self._validate_output_file(file_path, file_errors)
+                    with self._memory_file_phase(file_path, "scan"):
+                        scan_result = next(scan_results)
+                    self._validate_output_file(file_path, file_errors, scan_result)
 
                     if file_errors:
+                        self.error_count += len(file_errors)
                         if not has_files_with_errors:
                             self._output(f"- {normalized_relative_root}\\:")
                             has_files_with_errors = True
@@ -1,5 +1,23 @@
 # __init__.py
 
-from .config_setup import ConfigSetup
-from .custom_type_handlers import *
-from .func_helpers import *
\ No newline at end of file
+from importlib import import_module
+
+from .func_helpers import *
+from .background_job import BackgroundJob
+from .console_sink import BufferedConsoleSink
+
+# The config helpers depend on customtkinter; import them on first use so the
+# functions package and the command line entry point stay free of Tk.
+_LAZY_EXPORTS = {
+    "ConfigSetup": ".config_setup",
+    "CtkStringVarTypeHandler": ".custom_type_handlers",
+    "CtkBooleanVarTypeHandler": ".custom_type_handlers",
+    "ListTypeHandler": ".custom_type_handlers",
+    "TupleTypeHandler": ".custom_type_handlers",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
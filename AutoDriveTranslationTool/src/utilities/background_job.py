@@ -0,0 +1,108 @@
+# AutoDriveTranslationTool/src/utilities/background_job.py
+
+import queue
+import threading
+
+
+class _QueuedProgressBar:
+    """Progress bar stand-in for worker threads that posts values onto the job's event queue."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def set(self, value):
+        self.events.put(("progress", value))
+
+    def update(self):
+        """Redraws happen on the main thread when the queue is drained."""
+
+
+class _QueuedConsole:
+    """Console stand-in for worker threads that posts messages onto the job's event queue."""
+
+    def __init__(self, events):
+        self.events = events
+
+    def write_console(self, message):
+        self.events.put(("console", message))
+
+    def clear_console(self):
+        self.events.put(("clear", None))
+
+
+class BackgroundJob:
+    """Run a function on a worker thread while the Tk main loop drains its progress and console events."""
+
+    FRAME_INTERVAL_MS = 33
+
+    def __init__(self, window, target, output_widget=None, progress_bar=None, on_done=None):
+        """Prepare a job; target is called with the job and uses its progress_bar, output_widget and cancel_event."""
+        self.window = window
+        self.target = target
+        self.real_output_widget = output_widget
+        self.real_progress_bar = progress_bar
+        self.on_done = on_done
+
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.progress_bar = _QueuedProgressBar(self.events)
+        self.output_widget = _QueuedConsole(self.events)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start the worker thread and the periodic queue drain on the main loop."""
+        self._thread.start()
+        self.window.after(self.FRAME_INTERVAL_MS, self._drain_events)
+
+    def cancel(self):
+        """Ask the job to stop at the next point where it checks cancel_event."""
+        self.cancel_event.set()
+
+    def is_running(self):
+        return self._thread.is_alive()
+
+    def _run(self):
+        error = None
+        try:
+            self.target(self)
+        except Exception as e:
+            error = e
+        finally:
+            self.events.put(("done", error))
+
+    def _drain_events(self):
+        """Apply all queued events at once: the last progress value and a single console insert."""
+        progress = None
+        console_messages = []
+        clear_console = False
+        done = False
+        error = None
+        while True:
+            try:
+                event_type, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event_type == "progress":
+                progress = payload
+            elif event_type == "console":
+                console_messages.append(payload)
+            elif event_type == "clear":
+                clear_console = True
+                console_messages = []
+            elif event_type == "done":
+                done = True
+                error = payload
+
+        if self.real_output_widget:
+            if clear_console:
+                self.real_output_widget.clear_console()
+            if console_messages:
+                self.real_output_widget.write_console(''.join(console_messages))
+        if self.real_progress_bar and progress is not None:
+            self.real_progress_bar.set(progress)
+
+        if done:
+            if self.on_done:
+                self.on_done(error)
+        else:
+            self.window.after(self.FRAME_INTERVAL_MS, self._drain_events)
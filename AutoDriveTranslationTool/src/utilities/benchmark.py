@@ -0,0 +1,231 @@
+# AutoDriveTranslationTool/src/utilities/benchmark.py
+
+import os
+import json
+import time
+import shutil
+import platform
+import statistics
+import tracemalloc
+from datetime import datetime
+
+from AutoDriveTranslationTool.src.functions import Translator, Validator, TranslationFinder
+from AutoDriveTranslationTool.src.functions.pre_translate_dictionary import update_local_dictionary
+from AutoDriveTranslationTool.src.functions.suggestion_index import SuggestionIndex
+from AutoDriveTranslationTool.src.functions.translation_worker import clear_memo
+from AutoDriveTranslationTool.src.utilities.synthetic_corpus import generate_dictionary_entries, generate_misspelled_terms, write_dictionary, write_course_corpus
+
+
+# Bump whenever the layout of the results file changes.
+RESULTS_VERSION = 1
+# Upper limits of figures that must hold on their own, independent of any baseline: (benchmark, metric, limit).
+LIMITS = (("suggest", "milliseconds_per_lookup", 1.0),)
+
+
+class _NullConsole:
+    """Output widget that discards every message."""
+
+    def write_console(self, message):
+        pass
+
+    def clear_console(self):
+        pass
+
+
+def load_results(results_path):
+    """Read a benchmark results file."""
+    with open(results_path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save_results(results_path, results):
+    """Write benchmark results as JSON."""
+    os.makedirs(os.path.dirname(os.path.abspath(results_path)), exist_ok=True)
+    with open(results_path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+        file.write('\n')
+
+
+def compare_results(results, baseline, tolerance=0.1):
+    """Return (benchmark, metric, value, baseline_value, ratio) for every time or memory figure above the baseline by more than tolerance."""
+    regressions = []
+    for name, benchmark in results["benchmarks"].items():
+        baseline_benchmark = baseline.get("benchmarks", {}).get(name)
+        if not baseline_benchmark:
+            continue
+        for metric in ("seconds", "peak_memory_bytes"):
+            value, baseline_value = benchmark.get(metric), baseline_benchmark.get(metric)
+            if value and baseline_value and value / baseline_value > 1 + tolerance:
+                regressions.append((name, metric, value, baseline_value, value / baseline_value))
+    return regressions
+
+
+def check_limits(results):
+    """Return (benchmark, metric, value, limit) for every figure of LIMITS at or above its limit."""
+    exceeded = []
+    for name, metric, limit in LIMITS:
+        value = results["benchmarks"].get(name, {}).get(metric)
+        if value is not None and value >= limit:
+            exceeded.append((name, metric, value, limit))
+    return exceeded
+
+
+class BenchmarkSuite:
+    """Time the functions package on a synthetic corpus and record throughput and peak memory per function.
+
+    Every function runs repeat times for the timing; the fastest run is reported, since slower runs only add
+    noise from the rest of the system. One extra run under tracemalloc measures the peak of Python allocations.
+    Workers are fixed to one process so the peak covers all the work, and every translation run starts with an
+    empty translation memo while the compiled dictionaries stay cached, like a fresh start of the tool. The output
+    folder is emptied before every translation run, otherwise the unchanged outputs of the previous run would be
+    left untouched and the writes not measured. Suggestions are looked up in an index of suggestion_size entries,
+    apart from the dictionary the courses are translated with, so the lookup limit is checked at a realistic size.
+    """
+
+    def __init__(self, work_path, localization_manager, languages=("English", "French"), file_count=20, waypoint_count=5000, mapmarker_count=200, dictionary_size=2000, suggestion_size=10000, suggestion_lookups=500, repeat=3, seed=0):
+        """Initialize the suite; the corpus is generated below work_path, which is replaced on every run."""
+        self.work_path = os.path.normpath(work_path)
+        self.localization_manager = localization_manager
+        self.languages = list(languages)
+        self.file_count = file_count
+        self.waypoint_count = waypoint_count
+        self.mapmarker_count = mapmarker_count
+        self.dictionary_size = dictionary_size
+        self.suggestion_size = suggestion_size
+        self.suggestion_lookups = suggestion_lookups
+        self.repeat = max(1, repeat)
+        self.seed = seed
+
+        self.input_path = os.path.join(self.work_path, "_input")
+        self.output_path = os.path.join(self.work_path, "_output")
+        self.dictionaries_path = os.path.join(self.work_path, "_dictionaries")
+        self.cache_path = os.path.join(self.work_path, "_cache")
+        self.course_files = []
+        self.dictionaries = []
+
+    def _prepare(self):
+        """Generate the courses and dictionaries."""
+        shutil.rmtree(self.work_path, ignore_errors=True)
+        entries = generate_dictionary_entries(self.dictionary_size, self.seed)
+        self.dictionaries = []
+        for language in self.languages:
+            dictionary_path = os.path.join(self.dictionaries_path, language, "Synthetic.dic")
+            write_dictionary(dictionary_path, entries)
+            self.dictionaries.append((os.path.basename(dictionary_path), dictionary_path))
+        self.course_files = write_course_corpus(self.input_path, self.file_count, self.waypoint_count, self.mapmarker_count, list(entries), self.seed)
+
+        # update_local_dictionary reads plain entry lines only, a local dictionary is the global one with half the terms untranslated.
+        self.global_dictionary_path = os.path.join(self.work_path, "global.dic")
+        self.local_dictionary_path = os.path.join(self.work_path, "local.dic")
+        write_dictionary(self.global_dictionary_path, entries, header=False)
+        write_dictionary(self.local_dictionary_path, {source_text: (target_text if index % 2 else "") for index, (source_text, target_text) in enumerate(entries.items())}, header=False)
+
+    def _measure(self, function, setup=None):
+        """Return the durations of repeat runs of function and the peak of Python allocations of one more run; setup runs untimed before every run."""
+        durations = []
+        for _ in range(self.repeat):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - start)
+
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            function()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return durations, peak_memory
+
+    def _benchmark(self, function, files, markers, size_bytes, setup=None):
+        durations, peak_memory = self._measure(function, setup)
+        seconds = min(durations)
+        return {
+            "seconds": seconds,
+            "seconds_median": statistics.median(durations),
+            "files": files,
+            "markers": markers,
+            "bytes": size_bytes,
+            "files_per_second": files / seconds if seconds else None,
+            "markers_per_second": markers / seconds if markers is not None and seconds else None,
+            "megabytes_per_second": size_bytes / seconds / 1024 / 1024 if seconds else None,
+            "peak_memory_bytes": peak_memory,
+        }
+
+    @staticmethod
+    def _get_size(file_paths):
+        return sum(os.path.getsize(file_path) for file_path in file_paths)
+
+    def run(self):
+        """Generate the corpus, run every benchmark and return the results."""
+        self._prepare()
+        course_bytes = self._get_size(file_path for _, file_path in self.course_files)
+        marker_count = self.file_count * self.mapmarker_count
+        language_count = len(self.languages)
+
+        translate_phase_times = []
+
+        def _clear_translation():
+            clear_memo()
+            shutil.rmtree(self.output_path, ignore_errors=True)
+
+        def _translate():
+            translator = Translator(
+                input_files=list(self.course_files), dictionaries=list(self.dictionaries), input_path=self.input_path,
+                output_path=self.output_path, whole_word=True, localization_manager=self.localization_manager,
+                cache_path=self.cache_path, workers=1, incremental=False
+            )
+            translate_phase_times.append(translator.stats.phase_times.totals)
+
+        benchmarks = {}
+        benchmarks["translate"] = self._benchmark(_translate, self.file_count, marker_count, course_bytes, setup=_clear_translation)
+        # Phase times of the fastest timed run; the last run was slowed down by tracemalloc.
+        benchmarks["translate"]["phases_ns"] = min(translate_phase_times[:self.repeat], key=lambda phase_times: sum(phase_times.values()))
+
+        output_files = [os.path.join(root, file) for root, _, files in os.walk(self.output_path) for file in files if file.endswith(".xml")]
+        benchmarks["validate"] = self._benchmark(
+            lambda: Validator(input_path=self.output_path, languages=self.languages, localization_manager=self.localization_manager, workers=1),
+            len(output_files), marker_count * language_count, self._get_size(output_files)
+        )
+        benchmarks["find_missing"] = self._benchmark(
+            lambda: TranslationFinder(
+                input_path=self.input_path, output_path=os.path.join(self.work_path, "missing_translations.txt"),
+                dictionary_path=self.dictionaries_path, languages=self.languages, localization_manager=self.localization_manager
+            ),
+            self.file_count, marker_count, course_bytes
+        )
+        benchmarks["update_local_dictionary"] = self._benchmark(
+            lambda: update_local_dictionary(self.global_dictionary_path, self.local_dictionary_path, os.path.join(self.work_path, "updated.dic"), output_widget=_NullConsole()),
+            1, None, self._get_size([self.local_dictionary_path])
+        )
+
+        suggestion_index = SuggestionIndex(generate_dictionary_entries(self.suggestion_size, self.seed))
+        lookup_terms = generate_misspelled_terms([source_text for source_text, _ in suggestion_index.entries], self.suggestion_lookups, self.seed)
+        benchmarks["suggest"] = self._benchmark(
+            lambda: [suggestion_index.suggest(term) for term in lookup_terms],
+            1, None, sum(len(term.encode('utf-8')) for term in lookup_terms)
+        )
+        benchmarks["suggest"]["lookups"] = len(lookup_terms)
+        benchmarks["suggest"]["milliseconds_per_lookup"] = benchmarks["suggest"]["seconds"] / len(lookup_terms) * 1000 if lookup_terms else None
+
+        return {
+            "version": RESULTS_VERSION,
+            "created": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": {
+                "languages": self.languages,
+                "file_count": self.file_count,
+                "waypoint_count": self.waypoint_count,
+                "mapmarker_count": self.mapmarker_count,
+                "dictionary_size": self.dictionary_size,
+                "suggestion_size": self.suggestion_size,
+                "suggestion_lookups": self.suggestion_lookups,
+                "repeat": self.repeat,
+                "seed": self.seed,
+            },
+            "benchmarks": benchmarks,
+        }
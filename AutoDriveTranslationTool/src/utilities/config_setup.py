@@ -46,6 +46,7 @@ class ConfigSetup:
             {"name": "input_path", "section": "AppSettings", "type_": str, "value": "_input", "init_from_file": False, "save_to_file": False},
             {"name": "output_path", "section": "AppSettings", "type_": str, "value": "_output", "init_from_file": False, "save_to_file": False},
             {"name": "dictionaries_path", "section": "AppSettings", "type_": str, "value": "_dictionaries", "init_from_file": False, "save_to_file": False},
+            {"name": "cache_path", "section": "AppSettings", "type_": str, "value": "_cache", "init_from_file": False, "save_to_file": False},
 
             {"name": "save_window_size", "section": "WindowSettings", "type_": ctk.BooleanVar, "value": ctk.BooleanVar(value=True)},
             {"name": "save_window_pos", "section": "WindowSettings", "type_": ctk.BooleanVar, "value": ctk.BooleanVar(value=True)},
@@ -62,6 +63,13 @@ class ConfigSetup:
             {"name": "selected_languages", "section": "TranslationSettings", "type_": list, "value": [""]},
             {"name": "supported_languages", "section": "TranslationSettings", "type_": list, "value": ["English", "French", "German", "Italian", "Russian"]},
             {"name": "whole_word_replacement", "section": "TranslationSettings", "type_": ctk.BooleanVar, "value": ctk.BooleanVar(value=True)},
+            {"name": "translation_workers", "section": "TranslationSettings", "type_": int, "value": 1},
+            {"name": "translation_output_mode", "section": "TranslationSettings", "type_": str, "value": "tree"},
+            {"name": "translation_memo_size", "section": "TranslationSettings", "type_": int, "value": 50000},
+            {"name": "max_name_length", "section": "TranslationSettings", "type_": int, "value": 30},
+            {"name": "max_group_length", "section": "TranslationSettings", "type_": int, "value": 20},
+            {"name": "matcher_engine", "section": "TranslationSettings", "type_": str, "value": "regex"},
+            {"name": "enable_profiling", "section": "TranslationSettings", "type_": ctk.BooleanVar, "value": ctk.BooleanVar(value=False)},
 
             {"name": "dropdown_ui_themes", "section": "AppearanceSettings", "type_": list, "value": UI_THEMES, "init_from_file": False, "save_to_file": False},
             {"name": "dropdown_ui_color_themes", "section": "AppearanceSettings", "type_": list, "value": UI_COLOR_THEMES, "init_from_file": False, "save_to_file": False},
@@ -82,7 +90,7 @@ class ConfigSetup:
                 default_value=data.get("default_value", None),
                 init_from_file=data.get("init_from_file", True)
             )
-        paths = [CKL.LOCALES_PATH, CKL.RESOURCES_PATH, CKL.INPUT_PATH, CKL.OUTPUT_PATH, CKL.DICTIONARIES_PATH]
+        paths = [CKL.LOCALES_PATH, CKL.RESOURCES_PATH, CKL.INPUT_PATH, CKL.OUTPUT_PATH, CKL.DICTIONARIES_PATH, CKL.CACHE_PATH]
         for path in paths:
             original_path = ConfigHandler.get_variable_value(path)
             ConfigHandler.set_variable_value(path, FileOps.resolve_development_path(__file__, original_path, root_marker="AutoDriveTranslationTool"))
@@ -110,6 +118,13 @@ class ConfigSetup:
             "TranslationSettings": {
                 "selected_languages": "English",
                 "supported_languages": "English,French,German,Italian,Russian,Spanish",
-                "whole_word_replacement": "True"
+                "whole_word_replacement": "True",
+                "translation_workers": "1",
+                "translation_output_mode": "tree",
+                "translation_memo_size": "50000",
+                "max_name_length": "30",
+                "max_group_length": "20",
+                "matcher_engine": "regex",
+                "enable_profiling": "False"
             }
         }
@@ -0,0 +1,97 @@
+# AutoDriveTranslationTool/src/utilities/console_sink.py
+
+import os
+import threading
+import time
+
+
+class BufferedConsoleSink:
+    """Console stand-in that batches messages into chunked widget inserts and keeps the full log on disk."""
+
+    def __init__(self, console_widget, window=None, log_file_path=None, flush_interval_ms=100, max_lines=1000, max_log_bytes=8 * 1024 * 1024):
+        """Wrap a console widget; with a window the flush is scheduled on its main loop, otherwise it happens on write."""
+        self.console_widget = console_widget
+        self.window = window
+        self.log_file_path = log_file_path
+        self.flush_interval_ms = flush_interval_ms
+        self.max_lines = max_lines
+        self.max_log_bytes = max_log_bytes
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self._clear_pending = False
+        self._flush_scheduled = False
+        self._last_flush = 0.0
+        self._log_file = None
+
+        if self.log_file_path:
+            os.makedirs(os.path.dirname(self.log_file_path), exist_ok=True)
+            # Like the application log, the log of the previous session is kept as the .1 backup.
+            if os.path.isfile(self.log_file_path) and os.path.getsize(self.log_file_path):
+                os.replace(self.log_file_path, self.log_file_path + '.1')
+            self._log_file = open(self.log_file_path, 'w', encoding='utf-8')
+
+    def write_console(self, message):
+        """Queue a message for the widget and append it to the log file."""
+        with self._lock:
+            self._pending.append(message)
+            self._write_log(message)
+        self._request_flush()
+
+    def clear_console(self):
+        """Drop everything still queued and clear the widget on the next flush; the log file is kept."""
+        with self._lock:
+            self._pending = []
+            self._clear_pending = True
+        self._request_flush()
+
+    def flush(self):
+        """Insert the queued tail into the widget in one call. Must run on the Tk main thread."""
+        with self._lock:
+            messages = self._pending
+            clear_console = self._clear_pending
+            self._pending = []
+            self._clear_pending = False
+            self._flush_scheduled = False
+            self._last_flush = time.monotonic()
+            if self._log_file:
+                self._log_file.flush()
+
+        if clear_console:
+            self.console_widget.clear_console()
+        if messages:
+            self.console_widget.write_console(self._tail(''.join(messages)))
+
+    def close(self):
+        """Flush the remaining messages and close the log file."""
+        self.flush()
+        with self._lock:
+            if self._log_file:
+                self._log_file.close()
+                self._log_file = None
+
+    def _request_flush(self):
+        if self.window:
+            with self._lock:
+                if self._flush_scheduled:
+                    return
+                self._flush_scheduled = True
+            self.window.after(self.flush_interval_ms, self.flush)
+        elif (time.monotonic() - self._last_flush) * 1000 >= self.flush_interval_ms:
+            self.flush()
+
+    def _tail(self, text):
+        """Trim text to the lines the widget would keep anyway."""
+        if not self.max_lines or text.count('\n') <= self.max_lines:
+            return text
+        return '\n'.join(text.rsplit('\n', self.max_lines + 1)[1:])
+
+    def _write_log(self, message):
+        """Append to the log file, moving it to a single .1 backup once it reaches max_log_bytes."""
+        if not self._log_file:
+            return
+        if self._log_file.tell() >= self.max_log_bytes:
+            self._log_file.close()
+            os.replace(self.log_file_path, self.log_file_path + '.1')
+            self._log_file = open(self.log_file_path, 'w', encoding='utf-8')
+        self._log_file.write(message)
@@ -0,0 +1,130 @@
+# AutoDriveTranslationTool/src/utilities/synthetic_corpus.py
+
+import os
+import random
+
+
+# Building blocks of German map marker terms and their English counterparts.
+TERM_PARTS = (
+    ("Kalk", "Lime"), ("Saatgut", "Seeds"), ("Dünger", "Fertilizer"), ("Gülle", "Slurry"), ("Mist", "Manure"),
+    ("Getreide", "Grain"), ("Silo", "Silo"), ("Hof", "Farm"), ("Feld", "Field"), ("Stall", "Barn"),
+    ("Kuh", "Cow"), ("Schwein", "Pig"), ("Huhn", "Chicken"), ("Schaf", "Sheep"), ("Holz", "Wood"),
+    ("Säge", "Saw"), ("Mühle", "Mill"), ("Bäckerei", "Bakery"), ("Molkerei", "Dairy"), ("Tankstelle", "Gas station"),
+    ("Werkstatt", "Workshop"), ("Händler", "Dealer"), ("Lager", "Storage"), ("Halle", "Hall"), ("Wiese", "Meadow"),
+    ("Ballen", "Bales"), ("Stroh", "Straw"), ("Heu", "Hay"), ("Zucker", "Sugar"), ("Rüben", "Beets"),
+)
+DIRECTIONS = (("Nord", "North"), ("Süd", "South"), ("Ost", "East"), ("West", "West"))
+PREFIXES = (("EK-", "B-"), ("VK-", "S-"))
+# Words that no generated dictionary translates, so missing translation searches have something to find.
+UNKNOWN_WORDS = ("Buur Hans", "HaGe", "Raiffeisen", "Lohnunternehmer", "Biogasanlage", "Spinnerei")
+
+
+def generate_dictionary_entries(entry_count, seed=0):
+    """Return entry_count unique (source_text, target_text) entries built from compound map marker terms."""
+    rng = random.Random(seed)
+    entries = {}
+    for source_text, target_text in TERM_PARTS + DIRECTIONS:
+        if len(entries) >= entry_count:
+            return entries
+        entries[source_text] = target_text
+
+    # Longer compounds and prefixed or directional variants overlap the short entries like real dictionaries do.
+    attempts = 0
+    while len(entries) < entry_count and attempts < entry_count * 20:
+        attempts += 1
+        parts = rng.sample(TERM_PARTS, rng.choice((2, 2, 3)))
+        source_text = parts[0][0] + ''.join(part[0].lower() for part in parts[1:])
+        target_text = ' '.join(part[1] for part in parts)
+        if rng.random() < 0.3:
+            prefix = rng.choice(PREFIXES)
+            source_text, target_text = prefix[0] + source_text, prefix[1] + target_text
+        if rng.random() < 0.3:
+            direction = rng.choice(DIRECTIONS)
+            source_text, target_text = f"{source_text} {direction[0]}", f"{target_text} {direction[1]}"
+        if rng.random() < 0.2:
+            source_text, target_text = f"{source_text} {rng.randint(1, 99)}", f"{target_text} {rng.randint(1, 99)}"
+        entries.setdefault(source_text, target_text)
+    return entries
+
+
+def generate_misspelled_terms(source_texts, count, seed=0):
+    """Return count terms that miss a dictionary entry by one letter: a trailing s, a dropped last or third letter."""
+    rng = random.Random(seed)
+    terms = []
+    for source_text in rng.sample(list(source_texts), min(count, len(source_texts))):
+        variant = rng.randrange(3)
+        terms.append(source_text + "s" if variant == 0 else source_text[:-1] if variant == 1 else source_text[:2] + source_text[3:])
+    return terms
+
+
+def write_dictionary(dictionary_path, entries, header=True):
+    """Write entries as a .dic file, with the comment header of the shipped dictionaries unless header is False."""
+    os.makedirs(os.path.dirname(dictionary_path), exist_ok=True)
+    with open(dictionary_path, 'w', encoding='utf-8') as file:
+        if header:
+            file.write("###*\n\n    Synthetic benchmark dictionary\n\n*###\n\n")
+        file.writelines(f"{source_text},{target_text}\n" for source_text, target_text in entries.items())
+
+
+def _format_coordinates(rng, count, scale):
+    return ','.join(f"{rng.uniform(-scale, scale):.3f}" for _ in range(count))
+
+
+def generate_course_xml(waypoint_count, mapmarker_count, vocabulary, seed=0, unknown_ratio=0.1):
+    """Return an AutoDrive course with the given numbers of waypoints and map markers.
+
+    Marker names and groups are drawn from vocabulary, a sequence of source texts, mixed with unknown_ratio
+    words no dictionary translates. Names are up to three terms long so some exceed AutoDrive's length limits.
+    """
+    rng = random.Random(seed)
+    vocabulary = list(vocabulary) or [part[0] for part in TERM_PARTS]
+
+    def _marker_text(term_count):
+        words = [rng.choice(UNKNOWN_WORDS) if rng.random() < unknown_ratio else rng.choice(vocabulary) for _ in range(term_count)]
+        # Escaped characters appear in real courses, e.g. "Hof &amp; Feld".
+        return (' &amp; ' if rng.random() < 0.05 else ' ').join(words)
+
+    # Waypoints connect to their neighbours, the outgoing and incoming lists dominate the file size like in real courses.
+    outgoing = ';'.join(str(index + 2 if index + 1 < waypoint_count else -1) for index in range(waypoint_count))
+    incoming = ';'.join(str(index if index > 0 else -1) for index in range(waypoint_count))
+    lines = [
+        '<?xml version="1.0" encoding="utf-8" standalone="no"?>',
+        '<AutoDrive>',
+        '    <version>2.0</version>',
+        '    <MapName>Synthetic</MapName>',
+        '    <waypoints>',
+        f'        <c>{waypoint_count}</c>',
+        f'        <id>{",".join(str(index + 1) for index in range(waypoint_count))}</id>',
+        f'        <x>{_format_coordinates(rng, waypoint_count, 1024)}</x>',
+        f'        <y>{_format_coordinates(rng, waypoint_count, 128)}</y>',
+        f'        <z>{_format_coordinates(rng, waypoint_count, 1024)}</z>',
+        f'        <out>{outgoing}</out>',
+        f'        <incoming>{incoming}</incoming>',
+        f'        <flags>{",".join("0" for _ in range(waypoint_count))}</flags>',
+        '    </waypoints>',
+        '    <mapmarker>',
+    ]
+    for index in range(1, mapmarker_count + 1):
+        lines += [
+            f'        <mm{index}>',
+            f'            <id>{rng.randint(1, max(waypoint_count, 1))}</id>',
+            f'            <name>{_marker_text(rng.randint(1, 3))}</name>',
+            f'            <group>{_marker_text(1)}</group>',
+            f'        </mm{index}>',
+        ]
+    lines += ['    </mapmarker>', '</AutoDrive>', '']
+    return '\n'.join(lines)
+
+
+def write_course_corpus(input_path, file_count, waypoint_count, mapmarker_count, vocabulary, seed=0, folder_count=2):
+    """Write file_count courses spread over folder_count map folders and return their (file_name, file_path) pairs."""
+    course_files = []
+    for index in range(file_count):
+        folder_path = os.path.join(input_path, f"map{index % max(folder_count, 1)}")
+        os.makedirs(folder_path, exist_ok=True)
+        file_name = f"AutoDrive_config_{index}.xml"
+        file_path = os.path.join(folder_path, file_name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(generate_course_xml(waypoint_count, mapmarker_count, vocabulary, seed=seed + index))
+        course_files.append((file_name, file_path))
+    return course_files